@@ -76,6 +76,9 @@ from .logging import (
 # Application path (path where this script is located)
 apps_path = os.path.realpath(os.path.dirname(__file__))
 
+# Number of parameter rows whose widgets are created at a time
+row_batch = 20
+
 
 class ConfirmDialog(Dialog):
     """Simple dialog for confirming quit"""
@@ -155,6 +158,8 @@ class CACEGui(ttk.Frame):
         self.filename = '(no selection)'
         self.logfile = None
         self.parameter_widgets = {}
+        self.realize_id = None
+        self.configure_pending = False
 
         # Root window title
         self.root.title('CACE')
@@ -453,19 +458,19 @@ class CACEGui(ttk.Frame):
         """Simulate a single parameter"""
 
         self.parameter_manager.set_runtime_options(
-            'force', self.settings.get_force()
+            'force', self.settings.get_setting('force')
         )
         self.parameter_manager.set_runtime_options(
-            'keep', self.settings.get_keep()
+            'keep', self.settings.get_setting('keep')
         )
         self.parameter_manager.set_runtime_options(
-            'sequential', self.settings.get_sequential()
+            'sequential', self.settings.get_setting('sequential')
         )
         self.parameter_manager.set_runtime_options(
-            'noplot', self.settings.get_noplot()
+            'noplot', self.settings.get_setting('noplot')
         )
         self.parameter_manager.set_runtime_options(
-            'debug', self.settings.get_debug()
+            'debug', self.settings.get_setting('debug')
         )
         self.parameter_manager.set_runtime_options(
             'parallel_parameters', self.settings.get_parallel_parameters()
@@ -481,8 +486,10 @@ class CACEGui(ttk.Frame):
         )
 
         # Set the "Simulate" button to say "in progress"
-        self.parameter_widgets[pname].simulate_widget.configure(
-            text='(in progress)'
+        rowwidget = self.parameter_widgets[pname]
+        rowwidget.realize()
+        rowwidget.configure_widget(
+            rowwidget.simulate_widget, text='(in progress)'
         )
 
         self.update_simulate_all_button()
@@ -491,7 +498,16 @@ class CACEGui(ttk.Frame):
             self.parameter_manager.run_parameters_async()
 
     def frame_configure(self, event):
-        self.update_idletasks()
+        # Several <Configure> events may arrive for one change of the
+        # datasheet view (e.g., for each batch of rows);  update the scroll
+        # region only once, when Tk is idle.
+        if self.configure_pending:
+            return
+        self.configure_pending = True
+        self.after_idle(self.update_scrollregion)
+
+    def update_scrollregion(self):
+        self.configure_pending = False
         self.datasheet_viewer.configure(
             scrollregion=self.datasheet_viewer.bbox('all')
         )
@@ -500,7 +516,7 @@ class CACEGui(ttk.Frame):
         # Start a logfile (or append to it, if it already exists)
         # Disabled by default, as it can get very large.
         # Can be enabled from Settings.
-        if self.settings.get_log() == True:
+        if self.settings.get_setting('log') == True:
             dataroot = os.path.splitext(self.filename)[0]
             if not self.logfile:
                 self.logfile = open(dataroot + '.log', 'a')
@@ -527,7 +543,7 @@ class CACEGui(ttk.Frame):
                 self.logfile.flush()
 
     def find_datasheet(self, search_dir):
-        debug = self.settings.get_debug()
+        debug = self.settings.get_setting('debug')
         if self.parameter_manager.find_datasheet(search_dir, debug):
             # Could not find a datasheet
             return 1
@@ -542,7 +558,7 @@ class CACEGui(ttk.Frame):
             self.logfile.close()
             self.logfile = None
 
-        debug = self.settings.get_debug()
+        debug = self.settings.get_setting('debug')
 
         # Load the new datasheet
         if self.parameter_manager.load_datasheet(datasheet_path, debug):
@@ -667,19 +683,19 @@ class CACEGui(ttk.Frame):
 
         # TODO set at startup and only change directly if necessary
         self.parameter_manager.set_runtime_options(
-            'force', self.settings.get_force()
+            'force', self.settings.get_setting('force')
         )
         self.parameter_manager.set_runtime_options(
-            'keep', self.settings.get_keep()
+            'keep', self.settings.get_setting('keep')
         )
         self.parameter_manager.set_runtime_options(
-            'sequential', self.settings.get_sequential()
+            'sequential', self.settings.get_setting('sequential')
         )
         self.parameter_manager.set_runtime_options(
-            'noplot', self.settings.get_noplot()
+            'noplot', self.settings.get_setting('noplot')
         )
         self.parameter_manager.set_runtime_options(
-            'debug', self.settings.get_debug()
+            'debug', self.settings.get_setting('debug')
         )
         self.parameter_manager.set_runtime_options(
             'parallel_parameters', self.settings.get_parallel_parameters()
@@ -728,7 +744,7 @@ class CACEGui(ttk.Frame):
         # Edit the conditions under which the parameter is tested.
         if (
             'editable' in param and param['editable'] == True
-        ) or self.settings.get_edit() == True:
+        ) or self.settings.get_setting('edit') == True:
             self.editparam.populate(param)
             self.editparam.open()
         else:
@@ -819,7 +835,7 @@ class CACEGui(ttk.Frame):
                 with open(anno, 'r') as file:
                     self.parameter_manager.set_datasheet(json.load(file))
             else:
-                debug = self.settings.get_debug()
+                debug = self.settings.get_setting('debug')
                 self.parameter_manager.set_datasheet(cace_read(file, debug))
         else:
             err('Error in simulation, no update to results.', file=sys.stderr)
@@ -987,6 +1003,11 @@ class CACEGui(ttk.Frame):
 
         dframe = self.datasheet_viewer.dframe
 
+        # Stop creating the rows of the previous view (if any)
+        if self.realize_id:
+            self.after_cancel(self.realize_id)
+            self.realize_id = None
+
         # Destroy the existing datasheet frame contents (if any)
         for widget in dframe.winfo_children():
             widget.destroy()
@@ -1074,8 +1095,7 @@ class CACEGui(ttk.Frame):
         ToolTip(self.allsimbutton, text='Simulate all electrical parameters')
 
         # Make all columns equally expandable
-        for i in range(10):
-            dframe.columnconfigure(i, weight=1)
+        dframe.columnconfigure(tuple(range(10)), weight=1)
 
         # Parse the file for electrical parameters
         n += 1
@@ -1092,6 +1112,23 @@ class CACEGui(ttk.Frame):
         for child in dframe.winfo_children():
             child.grid_configure(ipadx=5, ipady=1, padx=2, pady=2)
 
+        # Create the widgets of the parameter rows
+        self.realize_rows(list(self.parameter_widgets.values()))
+
+    def realize_rows(self, rows):
+        """Create the widgets of the parameter rows, a batch at a time so
+        that the first rows are shown without waiting for the rest"""
+
+        self.realize_id = None
+
+        for rowwidget in rows[:row_batch]:
+            rowwidget.realize()
+
+        if len(rows) > row_batch:
+            self.realize_id = self.after(
+                1, self.realize_rows, rows[row_batch:]
+            )
+
     def add_param_to_list(self, param, n, isschem):
         """Add a row of widgets to the datasheet viewer"""
 
@@ -15,6 +15,7 @@
 """spice_units.py: Converts tuple of (unit, value) into standard unit numeric value."""
 
 import re
+import functools
 
 from ..logging import (
     dbg,
@@ -134,29 +135,32 @@ def numeric(s):
 # time, so handling vectors is not particularly efficient.
 
 
-def spice_unit_convert(valuet, restrict=[]):
+@functools.lru_cache(maxsize=1024)
+def spice_unit_convert(valuet, restrict=None):
     """Convert SI units into spice values"""
     # valuet is a tuple of (unit, value), where "value" is numeric
     # and "unit" is a string.  "restrict" may be used to require that
     # the value be of a specific class like "time" or "resistance".
+    # The same values are converted for many condition sets, so the
+    # results are cached.  The arguments must therefore be hashable.
 
     # Recursive handling of '/' and multiplicatioon dot in expressions
     if '/' in valuet[0]:
         parts = valuet[0].split('/', 1)
-        result = numeric(spice_unit_convert([parts[0], valuet[1]], restrict))
-        result /= numeric(spice_unit_convert([parts[1], '1.0'], restrict))
+        result = numeric(spice_unit_convert((parts[0], valuet[1]), restrict))
+        result /= numeric(spice_unit_convert((parts[1], '1.0'), restrict))
         return str(result)
 
     if '\u22c5' in valuet[0]:  	# multiplication dot
         parts = valuet[0].split('\u22c5')
-        result = numeric(spice_unit_convert([parts[0], valuet[1]], restrict))
-        result *= numeric(spice_unit_convert([parts[1], '1.0'], restrict))
+        result = numeric(spice_unit_convert((parts[0], valuet[1]), restrict))
+        result *= numeric(spice_unit_convert((parts[1], '1.0'), restrict))
         return str(result)
 
     if '\u00b2' in valuet[0]:  	# squared
         part = valuet[0].split('\u00b2')[0]
-        result = numeric(spice_unit_convert([part, valuet[1]], restrict))
-        result *= numeric(spice_unit_convert([part, '1.0'], restrict))
+        result = numeric(spice_unit_convert((part, valuet[1]), restrict))
+        result *= numeric(spice_unit_convert((part, '1.0'), restrict))
         return str(result)
 
     if valuet[0] == '':  # null case, no units
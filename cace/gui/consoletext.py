@@ -12,7 +12,6 @@ with stdout and stderr redirection.
 # Version 0.1
 # --------------------------------------------------------
 
-import sys
 import tkinter
 
 
@@ -10,12 +10,115 @@
 # --------------------------------------------------------
 
 import os
-import re
 import tkinter
+import functools
 from tkinter import ttk
 
 from ..common.common import get_condition_names_used
 
+# Binding tag for the mousewheel scrolling of the conditions list
+scrolltag = 'EditParamScroll'
+
+# Calculation types
+calctypes = (
+    'minimum',
+    'maximum',
+    'average',
+    'diffmin',
+    'diffmax',
+    '(none)',
+)
+limittypes = ('above', 'below', 'exact', 'legacy', '(none)')
+steptypes = ('linear', 'logarithmic', '(none)')
+
+# Default limit type of each calculation type
+default_limits = {
+    'minimum': 'above',
+    'maximum': 'below',
+    'average': 'exact',
+    'diffmin': 'above',
+    'diffmax': 'below',
+}
+
+# Reserved variables
+reserved = frozenset(
+    {
+        'filename',
+        'simpath',
+        'DUT_name',
+        'N',
+        'DUT_path',
+        'PDK_ROOT',
+        'PDK',
+        'include_DUT',
+        'DUT_call',
+        'steptime',
+        'random',
+        '+',
+        '-',
+        '*',
+        '/',
+        'MIN',
+        'NEG',
+        'INT',
+        'FUNCTIONAL',
+    }
+)
+
+
+def as_list(rec):
+    """Return a spec record as a list (records may be a single string)."""
+    if isinstance(rec, str):
+        return [rec]
+    return rec or []
+
+
+def parse_calc(calcrec):
+    """
+    Split a calculation record 'calc-limit' into its calculation and
+    limit types.  If no limit type is given, use the default limit of
+    the calculation type.
+    """
+    try:
+        calctype, limittype = calcrec.split('-')
+    except ValueError:
+        calctype = calcrec
+        limittype = default_limits.get(calctype, '(none)')
+    return calctype, limittype
+
+
+@functools.lru_cache(maxsize=32)
+def cached_condition_names(template_path, mtime_ns):
+    """
+    Memoized get_condition_names_used().  The template modification
+    time is part of the cache key, so an edited template is re-read.
+    """
+    return get_condition_names_used(template_path)
+
+
+def get_template_mtime(template_path):
+    """Return the template modification time, or None if not found."""
+    try:
+        return os.stat(template_path).st_mtime_ns
+    except OSError:
+        return None
+
+
+class NormalLabel(ttk.Label):
+    """ttk.Label bound to the 'normal.TLabel' style."""
+
+    def __init__(self, master=None, **kwargs):
+        kwargs.setdefault('style', 'normal.TLabel')
+        ttk.Label.__init__(self, master, **kwargs)
+
+
+class BlueLabel(ttk.Label):
+    """ttk.Label bound to the 'blue.TLabel' style."""
+
+    def __init__(self, master=None, **kwargs):
+        kwargs.setdefault('style', 'blue.TLabel')
+        ttk.Label.__init__(self, master, **kwargs)
+
 
 class Condition(object):
     def __init__(self, parent=None):
@@ -52,6 +155,14 @@ class EditParam(tkinter.Toplevel):
 
         # Keep current parameter
         self.param = None
+        self.condtypes = []
+
+        # Make sure that scrollwheel pans the conditions list.  The
+        # binding is attached to a class tag that is only given to the
+        # conditions canvas and its children (see add_scroll_tag), so
+        # that it does not override the main window's bindings.
+        self.bind_class(scrolltag, '<Button-4>', self.on_mousewheel)
+        self.bind_class(scrolltag, '<Button-5>', self.on_mousewheel)
 
         # -------------------------------------------------------------
         # Add the entries that are common to all electrical parameters
@@ -143,10 +254,6 @@ class EditParam(tkinter.Toplevel):
         frame3.canvas.config(yscrollcommand=main_yscrollbar.set)
         main_yscrollbar.config(command=frame3.canvas.yview)
 
-        # Make sure that scrollwheel pans the window
-        frame3.canvas.bind_all('<Button-4>', self.on_mousewheel)
-        frame3.canvas.bind_all('<Button-5>', self.on_mousewheel)
-
         # Set up configure callback
         frame3.canvas.dframe.bind('<Configure>', self.frame_configure)
 
@@ -173,21 +280,13 @@ class EditParam(tkinter.Toplevel):
         pinlist.append('(none)')
 
         # Add common elements
-        frame1.lname = ttk.Label(
-            frame1, text='Name:', style='blue.TLabel', anchor='e'
-        )
-        frame1.ldescription = ttk.Label(
-            frame1, text='Description:', style='blue.TLabel', anchor='e'
-        )
-        frame1.ldisplay = ttk.Label(
-            frame1, text='Display:', style='blue.TLabel', anchor='e'
-        )
-        frame1.lmethod = ttk.Label(
-            frame1, text='Testbench:', style='blue.TLabel', anchor='e'
-        )
-        frame1.lunit = ttk.Label(
-            frame1, text='Unit:', style='blue.TLabel', anchor='e'
+        frame1.lname = BlueLabel(frame1, text='Name:', anchor='e')
+        frame1.ldescription = BlueLabel(
+            frame1, text='Description:', anchor='e'
         )
+        frame1.ldisplay = BlueLabel(frame1, text='Display:', anchor='e')
+        frame1.lmethod = BlueLabel(frame1, text='Testbench:', anchor='e')
+        frame1.lunit = BlueLabel(frame1, text='Unit:', anchor='e')
 
         # Find method and apply to OptionMenu
         if 'simulate' in param:
@@ -256,81 +355,49 @@ class EditParam(tkinter.Toplevel):
         else:
             spec = {}
 
-        # Calculation types
-        calctypes = [
-            'minimum',
-            'maximum',
-            'average',
-            'diffmin',
-            'diffmax',
-            '(none)',
-        ]
-        limittypes = ['above', 'below', 'exact', 'legacy', '(none)']
-
         # Add min/typ/max (To-do:  Add plot)
 
         frame2min = ttk.Frame(frame2, borderwidth=2, relief='groove')
         frame2min.grid(row=0, column=0, padx=2, pady=2, sticky='news')
-        ttk.Label(
-            frame2min, text='Minimum:', style='blue.TLabel', anchor='w'
-        ).grid(row=0, column=0, padx=5, sticky='news')
+        BlueLabel(frame2min, text='Minimum:', anchor='w').grid(
+            row=0, column=0, padx=5, sticky='news'
+        )
 
-        if 'minimum' in spec:
-            minrec = spec['minimum']
-        else:
-            minrec = []
-        if isinstance(minrec, str):
-            minrec = [minrec]
-        ttk.Label(
-            frame2min, text='Limit:', anchor='e', style='normal.TLabel'
-        ).grid(row=1, column=0, padx=5, sticky='news')
+        minrec = as_list(spec.get('minimum'))
+        NormalLabel(frame2min, text='Limit:', anchor='e').grid(
+            row=1, column=0, padx=5, sticky='news'
+        )
         frame2min.tmin = ttk.Entry(frame2min, textvariable=self.minrec.target)
         frame2min.tmin.grid(row=1, column=1, padx=5, sticky='news')
         frame2min.tmin.delete(0, 'end')
         if minrec:
             frame2min.tmin.insert(0, minrec[0])
-        ttk.Label(
-            frame2min, text='Penalty:', anchor='e', style='normal.TLabel'
-        ).grid(row=2, column=0, padx=5, sticky='news')
+        NormalLabel(frame2min, text='Penalty:', anchor='e').grid(
+            row=2, column=0, padx=5, sticky='news'
+        )
         frame2min.pmin = ttk.Entry(frame2min, textvariable=self.minrec.penalty)
         frame2min.pmin.grid(row=2, column=1, padx=5, sticky='news')
         frame2min.pmin.delete(0, 'end')
         if len(minrec) > 1:
             frame2min.pmin.insert(0, minrec[1])
         if len(minrec) > 2:
-            calcrec = minrec[2]
-            try:
-                calctype, limittype = calcrec.split('-')
-            except ValueError:
-                calctype = calcrec
-                if calctype == 'minimum':
-                    limittype = 'above'
-                elif calctype == 'maximum':
-                    limittype = 'below'
-                elif calctype == 'average':
-                    limittype = 'exact'
-                elif calctype == 'diffmin':
-                    limittype = 'above'
-                elif calctype == 'diffmax':
-                    limittype = 'below'
-                else:
-                    limittype = '(none)'
+            calctype, limittype = parse_calc(minrec[2])
         else:
             calctype = 'minimum'
             limittype = 'above'
 
-        ttk.Label(
-            frame2min, text='Calculation:', anchor='e', style='normal.TLabel'
-        ).grid(row=3, column=0, padx=5, sticky='news')
+        NormalLabel(frame2min, text='Calculation:', anchor='e').grid(
+            row=3, column=0, padx=5, sticky='news'
+        )
         self.cmin = tkinter.StringVar(self)
         self.cmin.set(calctype)
         frame2min.cmin = ttk.OptionMenu(
             frame2min, self.cmin, calctype, *calctypes
         )
         frame2min.cmin.grid(row=3, column=1, padx=5, sticky='news')
-        ttk.Label(
-            frame2min, text='Limit:', anchor='e', style='normal.TLabel'
-        ).grid(row=4, column=0, padx=5, sticky='news')
+        NormalLabel(frame2min, text='Limit:', anchor='e').grid(
+            row=4, column=0, padx=5, sticky='news'
+        )
         self.lmin = tkinter.StringVar(self)
         self.lmin.set(limittype)
         frame2min.lmin = ttk.OptionMenu(
@@ -340,65 +407,44 @@ class EditParam(tkinter.Toplevel):
 
         frame2typ = ttk.Frame(frame2, borderwidth=2, relief='groove')
         frame2typ.grid(row=0, column=1, padx=2, pady=2, sticky='news')
-        ttk.Label(
-            frame2typ, text='Typical:', style='blue.TLabel', anchor='w'
-        ).grid(row=0, column=0, padx=5, sticky='news')
-        if 'typical' in spec:
-            typrec = spec['typical']
-        else:
-            typrec = []
-        if isinstance(typrec, str):
-            typrec = [typrec]
-        ttk.Label(
-            frame2typ, text='Target:', anchor='e', style='normal.TLabel'
-        ).grid(row=1, column=0, padx=5, sticky='news')
+        BlueLabel(frame2typ, text='Typical:', anchor='w').grid(
+            row=0, column=0, padx=5, sticky='news'
+        )
+        typrec = as_list(spec.get('typical'))
+        NormalLabel(frame2typ, text='Target:', anchor='e').grid(
+            row=1, column=0, padx=5, sticky='news'
+        )
         frame2typ.ttyp = ttk.Entry(frame2typ, textvariable=self.typrec.target)
         frame2typ.ttyp.grid(row=1, column=1, padx=5, sticky='news')
         frame2typ.ttyp.delete(0, 'end')
         if typrec:
             frame2typ.ttyp.insert(0, typrec[0])
-        ttk.Label(
-            frame2typ, text='Penalty:', anchor='e', style='normal.TLabel'
-        ).grid(row=2, column=0, padx=5, sticky='news')
+        NormalLabel(frame2typ, text='Penalty:', anchor='e').grid(
+            row=2, column=0, padx=5, sticky='news'
+        )
         frame2typ.ptyp = ttk.Entry(frame2typ, textvariable=self.typrec.penalty)
         frame2typ.ptyp.grid(row=2, column=1, padx=5, sticky='news')
         frame2typ.ptyp.delete(0, 'end')
         if len(typrec) > 1:
             frame2typ.ptyp.insert(0, typrec[1])
         if len(typrec) > 2:
-            calcrec = typrec[2]
-            try:
-                calctype, limittype = calcrec.split('-')
-            except ValueError:
-                calctype = calcrec
-                if calctype == 'minimum':
-                    limittype = 'above'
-                elif calctype == 'maximum':
-                    limittype = 'below'
-                elif calctype == 'average':
-                    limittype = 'exact'
-                elif calctype == 'diffmin':
-                    limittype = 'above'
-                elif calctype == 'diffmax':
-                    limittype = 'below'
-                else:
-                    limittype = '(none)'
+            calctype, limittype = parse_calc(typrec[2])
         else:
             calctype = 'average'
             limittype = 'exact'
 
-        ttk.Label(
-            frame2typ, text='Calculation:', anchor='e', style='normal.TLabel'
-        ).grid(row=3, column=0, padx=5, sticky='news')
+        NormalLabel(frame2typ, text='Calculation:', anchor='e').grid(
+            row=3, column=0, padx=5, sticky='news'
+        )
         self.ctyp = tkinter.StringVar(self)
         self.ctyp.set(calctype)
         frame2typ.ctyp = ttk.OptionMenu(
             frame2typ, self.ctyp, calctype, *calctypes
         )
         frame2typ.ctyp.grid(row=3, column=1, padx=5, sticky='news')
-        ttk.Label(
-            frame2typ, text='Limit:', anchor='e', style='normal.TLabel'
-        ).grid(row=4, column=0, padx=5, sticky='news')
+        NormalLabel(frame2typ, text='Limit:', anchor='e').grid(
+            row=4, column=0, padx=5, sticky='news'
+        )
         self.ltyp = tkinter.StringVar(self)
         self.ltyp.set(limittype)
         frame2typ.ltyp = ttk.OptionMenu(
@@ -408,65 +454,44 @@ class EditParam(tkinter.Toplevel):
 
         frame2max = ttk.Frame(frame2, borderwidth=2, relief='groove')
         frame2max.grid(row=0, column=2, padx=2, pady=2, sticky='news')
-        ttk.Label(
-            frame2max, text='Maximum:', style='blue.TLabel', anchor='w'
-        ).grid(row=0, column=0, padx=5, sticky='news')
-        if 'maximum' in spec:
-            maxrec = spec['maximum']
-        else:
-            maxrec = []
-        if isinstance(maxrec, str):
-            maxrec = [maxrec]
-        ttk.Label(
-            frame2max, text='Limit:', anchor='e', style='normal.TLabel'
-        ).grid(row=1, column=0, padx=5, sticky='news')
+        BlueLabel(frame2max, text='Maximum:', anchor='w').grid(
+            row=0, column=0, padx=5, sticky='news'
+        )
+        maxrec = as_list(spec.get('maximum'))
+        NormalLabel(frame2max, text='Limit:', anchor='e').grid(
+            row=1, column=0, padx=5, sticky='news'
+        )
         frame2max.tmax = ttk.Entry(frame2max, textvariable=self.maxrec.target)
         frame2max.tmax.grid(row=1, column=1, padx=5, sticky='news')
         frame2max.tmax.delete(0, 'end')
         if maxrec != []:
             frame2max.tmax.insert(0, maxrec[0])
-        ttk.Label(
-            frame2max, text='Penalty:', anchor='e', style='normal.TLabel'
-        ).grid(row=2, column=0, padx=5, sticky='news')
+        NormalLabel(frame2max, text='Penalty:', anchor='e').grid(
+            row=2, column=0, padx=5, sticky='news'
+        )
         frame2max.pmax = ttk.Entry(frame2max, textvariable=self.maxrec.penalty)
         frame2max.pmax.grid(row=2, column=1, padx=5, sticky='news')
         frame2max.pmax.delete(0, 'end')
         if len(maxrec) > 1:
             frame2max.pmax.insert(0, maxrec[1])
         if len(maxrec) > 2:
-            calcrec = maxrec[2]
-            try:
-                calctype, limittype = calcrec.split('-')
-            except ValueError:
-                calctype = calcrec
-                if calctype == 'minimum':
-                    limittype = 'above'
-                elif calctype == 'maximum':
-                    limittype = 'below'
-                elif calctype == 'average':
-                    limittype = 'exact'
-                elif calctype == 'diffmin':
-                    limittype = 'above'
-                elif calctype == 'diffmax':
-                    limittype = 'below'
-                else:
-                    limittype = '(none)'
+            calctype, limittype = parse_calc(maxrec[2])
         else:
             calctype = 'maximum'
             limittype = 'below'
 
-        ttk.Label(
-            frame2max, text='Calculation:', anchor='e', style='normal.TLabel'
-        ).grid(row=3, column=0, padx=5, sticky='news')
+        NormalLabel(frame2max, text='Calculation:', anchor='e').grid(
+            row=3, column=0, padx=5, sticky='news'
+        )
         self.cmax = tkinter.StringVar(self)
         self.cmax.set(calctype)
         frame2max.cmax = ttk.OptionMenu(
             frame2max, self.cmax, calctype, *calctypes
         )
         frame2max.cmax.grid(row=3, column=1, padx=5, sticky='news')
-        ttk.Label(
-            frame2max, text='Limit:', anchor='e', style='normal.TLabel'
-        ).grid(row=4, column=0, padx=5, sticky='news')
+        NormalLabel(frame2max, text='Limit:', anchor='e').grid(
+            row=4, column=0, padx=5, sticky='news'
+        )
         self.lmax = tkinter.StringVar(self)
         self.lmax.set(limittype)
         frame2max.lmax = ttk.OptionMenu(
@@ -474,44 +499,35 @@ class EditParam(tkinter.Toplevel):
         )
         frame2max.lmax.grid(row=4, column=1, padx=5, sticky='news')
 
-        dframe = frame3.canvas.dframe
-
-        ttk.Label(
-            dframe, text='Conditions:', style='blue.TLabel', anchor='w'
-        ).grid(row=0, column=0, padx=5, sticky='news', columnspan=5)
-
-        # Reserved variables
-        reserved = [
-            'filename',
-            'simpath',
-            'DUT_name',
-            'N',
-            'DUT_path',
-            'PDK_ROOT',
-            'PDK',
-            'include_DUT',
-            'DUT_call',
-            'steptime',
-            'random',
-            '+',
-            '-',
-            '*',
-            '/',
-            'MIN',
-            'NEG',
-            'INT',
-            'FUNCTIONAL',
-        ]
-
         # Add conditions from the template's testbench
         # TO DO: Refresh this list if the testbench changes.
-        conddict = get_condition_names_used(tbpath, simrec['template'])
-        condtypes = []
-        for type in conddict.keys():
-            if type not in reserved:
-                condtypes.append(type)
+        template_path = os.path.join(tbpath, simrec['template'])
+        conddict = cached_condition_names(
+            template_path, get_template_mtime(template_path)
+        )
+        if not conddict:
+            conddict = {}
+        self.condtypes = [type for type in conddict if type not in reserved]
 
-        steptypes = ['linear', 'logarithmic', '(none)']
+        # Set the current parameter
+        self.param = param
+
+        self.populate_conditions()
+
+    def populate_conditions(self):
+        # Rebuild only the conditions list of the current parameter.
+        # This is all that changes when a condition is added or removed.
+        param = self.param
+        condtypes = self.condtypes
+        dframe = self.canvas.dframe
+
+        # Remove all existing conditions
+        for widget in dframe.winfo_children():
+            widget.destroy()
+
+        BlueLabel(dframe, text='Conditions:', anchor='w').grid(
+            row=0, column=0, padx=5, sticky='news', columnspan=5
+        )
 
         n = 0
         r = 1
@@ -528,9 +544,9 @@ class EditParam(tkinter.Toplevel):
 
             crec = Condition(self)
             # Condition description
-            ttk.Label(
-                frame3c, text='Display:', style='normal.TLabel', anchor='e'
-            ).grid(row=0, column=0, padx=5, sticky='news')
+            NormalLabel(frame3c, text='Display:', anchor='e').grid(
+                row=0, column=0, padx=5, sticky='news'
+            )
             c1 = ttk.Entry(frame3c, textvariable=crec.display)
             c1.grid(row=0, column=1, padx=5, sticky='news')
             c1.delete(0, 'end')
@@ -543,17 +559,17 @@ class EditParam(tkinter.Toplevel):
                 crec.condition.set(cond['name'])
             else:
                 crec.condition.set('(none)')
-            ttk.Label(
-                frame3c, text='Name:', style='normal.TLabel', anchor='e'
-            ).grid(row=1, column=0, padx=5, sticky='news')
+            NormalLabel(frame3c, text='Name:', anchor='e').grid(
+                row=1, column=0, padx=5, sticky='news'
+            )
             c2 = ttk.OptionMenu(
                 frame3c, crec.condition, crec.condition.get(), *condtypes
             )
             c2.grid(row=1, column=1, padx=5, sticky='news')
             # Condition unit
-            ttk.Label(
-                frame3c, text='Unit:', style='normal.TLabel', anchor='e'
-            ).grid(row=3, column=0, padx=5, sticky='news')
+            NormalLabel(frame3c, text='Unit:', anchor='e').grid(
+                row=3, column=0, padx=5, sticky='news'
+            )
             c4 = ttk.Entry(frame3c, textvariable=crec.unit)
             c4.grid(row=3, column=1, padx=5, sticky='news')
             c4.delete(0, 'end')
@@ -562,9 +578,9 @@ class EditParam(tkinter.Toplevel):
             else:
                 c4.insert(0, '(none)')
             # Condition min
-            ttk.Label(
-                frame3c, text='Minimum:', style='normal.TLabel', anchor='e'
-            ).grid(row=4, column=0, padx=5, sticky='news')
+            NormalLabel(frame3c, text='Minimum:', anchor='e').grid(
+                row=4, column=0, padx=5, sticky='news'
+            )
             c5 = ttk.Entry(frame3c, textvariable=crec.min)
             c5.grid(row=4, column=1, padx=5, sticky='news')
             c5.delete(0, 'end')
@@ -573,9 +589,9 @@ class EditParam(tkinter.Toplevel):
             else:
                 c5.insert(0, '(none)')
             # Condition typ
-            ttk.Label(
-                frame3c, text='Typical:', style='normal.TLabel', anchor='e'
-            ).grid(row=5, column=0, padx=5, sticky='news')
+            NormalLabel(frame3c, text='Typical:', anchor='e').grid(
+                row=5, column=0, padx=5, sticky='news'
+            )
             c6 = ttk.Entry(frame3c, textvariable=crec.typ)
             c6.grid(row=5, column=1, padx=5, sticky='news')
             c6.delete(0, 'end')
@@ -584,9 +600,9 @@ class EditParam(tkinter.Toplevel):
             else:
                 c6.insert(0, '(none)')
             # Condition max
-            ttk.Label(
-                frame3c, text='Maximum:', style='normal.TLabel', anchor='e'
-            ).grid(row=6, column=0, padx=5, sticky='news')
+            NormalLabel(frame3c, text='Maximum:', anchor='e').grid(
+                row=6, column=0, padx=5, sticky='news'
+            )
             c7 = ttk.Entry(frame3c, textvariable=crec.max)
             c7.grid(row=6, column=1, padx=5, sticky='news')
             c7.delete(0, 'end')
@@ -595,9 +611,9 @@ class EditParam(tkinter.Toplevel):
             else:
                 c7.insert(0, '(none)')
             # Condition steptype
-            ttk.Label(
-                frame3c, text='Step type:', style='normal.TLabel', anchor='e'
-            ).grid(row=7, column=0, padx=5, sticky='news')
+            NormalLabel(frame3c, text='Step type:', anchor='e').grid(
+                row=7, column=0, padx=5, sticky='news'
+            )
             c8 = ttk.OptionMenu(
                 frame3c, crec.steptype, crec.steptype.get(), *steptypes
             )
@@ -609,9 +625,9 @@ class EditParam(tkinter.Toplevel):
             else:
                 crec.steptype.set('(none)')
             # Condition step
-            ttk.Label(
-                frame3c, text='Step:', style='normal.TLabel', anchor='e'
-            ).grid(row=8, column=0, padx=5, sticky='news')
+            NormalLabel(frame3c, text='Step:', anchor='e').grid(
+                row=8, column=0, padx=5, sticky='news'
+            )
             c9 = ttk.Entry(frame3c, textvariable=crec.step)
             c9.grid(row=8, column=1, padx=5, sticky='news')
             c9.delete(0, 'end')
@@ -647,8 +663,16 @@ class EditParam(tkinter.Toplevel):
         else:
             dframe.bcond.grid(row=r, column=n, padx=5, pady=3, sticky='new')
 
-        # Set the current parameter
-        self.param = param
+        # Scroll the conditions list from anywhere inside of it
+        self.add_scroll_tag(self.canvas)
+
+    def add_scroll_tag(self, widget):
+        # Prepend the scroll binding tag to a widget and all its children
+        bindtags = widget.bindtags()
+        if scrolltag not in bindtags:
+            widget.bindtags((scrolltag,) + bindtags)
+        for child in widget.winfo_children():
+            self.add_scroll_tag(child)
 
     def on_mousewheel(self, event):
         if event.num == 5:
@@ -665,14 +689,14 @@ class EditParam(tkinter.Toplevel):
         newcond = {}
         newcond['name'] = '(none)'
         self.param['conditions'].append(newcond)
-        self.populate(self.param)
+        self.populate_conditions()
 
     def remove_condition(self, cond):
         # Remove and existing condition
         condlist = self.param['conditions']
         eidx = condlist.index(cond)
         condlist.pop(eidx)
-        self.populate(self.param)
+        self.populate_conditions()
 
     def apply(self):
         # Apply the values back to the parameter record
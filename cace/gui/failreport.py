@@ -11,16 +11,49 @@
 # ----------------------------------------------------------
 
 import os
-import base64
-import subprocess
+import concurrent.futures
 
 import tkinter
 from tkinter import ttk
+import tkinter.font
+
+import numpy
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
 from .tooltip import *
 from ..common.cace_makeplot import *
 from ..common.spiceunits import spice_unit_unconvert
 
+# Padding around widgets in the body of the failure report, so that the
+# frame background comes through, making a grid.  It is given when the
+# widgets are gridded.
+cellpadding = {'ipadx': 5, 'ipady': 1, 'padx': 2, 'pady': 2}
+
+# Number of rows of results that are kept in cells above and below the
+# visible part of the table.
+overscan = 10
+
+# Number of plot canvases kept for reuse
+maxplots = 8
+
+# Number of tables of results kept for reuse
+maxtables = 8
+
+
+def make_figure(dsheet, param):
+    """
+    Make the figure of param['plot'] without a Tk parent, so that it can
+    be run outside of the main thread.  Without a parent the plot is
+    drawn on a non-interactive canvas, as Parameter.makeplot() does,
+    and only its figure is returned, or None if plotting failed.
+    """
+    figcanvas = cace_makeplot(dsheet, param, parent=None)
+    figure = getattr(figcanvas, 'figure', None)
+    if isinstance(figure, Figure):
+        return figure
+    return None
+
 
 class FailReport(tkinter.Toplevel):
     """failure report window."""
@@ -63,13 +96,13 @@ class FailReport(tkinter.Toplevel):
         # Add scrollbars
         xscrollbar = ttk.Scrollbar(self.failframe, orient='horizontal')
         xscrollbar.grid(row=1, column=0, sticky='nsew')
-        yscrollbar = ttk.Scrollbar(self.failframe, orient='vertical')
-        yscrollbar.grid(row=0, column=1, sticky='nsew')
+        self.yscrollbar = ttk.Scrollbar(self.failframe, orient='vertical')
+        self.yscrollbar.grid(row=0, column=1, sticky='nsew')
         # Attach viewing area to scrollbars
         self.mainarea.config(xscrollcommand=xscrollbar.set)
         xscrollbar.config(command=self.mainarea.xview)
-        self.mainarea.config(yscrollcommand=yscrollbar.set)
-        yscrollbar.config(command=self.mainarea.yview)
+        self.mainarea.config(yscrollcommand=self.yscroll)
+        self.yscrollbar.config(command=self.mainarea.yview)
         # Set up configure callback
         self.mainarea.faildisplay.bind('<Configure>', self.frame_configure)
 
@@ -93,18 +126,71 @@ class FailReport(tkinter.Toplevel):
         self.sortdir = False
         self.data = []
 
+        # Tables of results made from the testbenches of each parameter,
+        # by parameter name.  At most maxtables are kept, least recently
+        # used first.
+        self.tables = {}
+        self.unitmap = {}
+        self.unitparam = None
+        self.configure_pending = False
+
+        # Plots that have been made, so that switching back and forth
+        # between table and plot views does not replot.  At most maxplots
+        # are kept, least recently used first.
+        self.plots = {}
+        self.plotrequest = 0
+
+        # New figures are made in a worker thread, see makeplot()
+        self.plotexecutor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1
+        )
+
+        # The table body and its pool of result cells are kept between
+        # calls to display() and reconfigured instead of being recreated.
+        # Only the rows of results in view are given cells.
+        self.body = None
+        self.headers = []
+        self.cells = []
+        self.cellstyles = []
+        self.cellfont = None
+        self.gridshape = (0, 0)
+        self.rows = []
+        self.rowvalues = []
+        self.sortheader = None
+        self.tablerows = 0
+        self.tablecols = 0
+        self.firstrow = None
+        self.rowpitch = None
+
     def grid_configure(self, padx, pady):
         pass
 
+    def yscroll(self, first, last):
+        # The view of the table changed; update the scrollbar and show
+        # the rows of results that came into view.
+        self.yscrollbar.set(first, last)
+        self.refresh_grid()
+
     def frame_configure(self, event):
-        self.update_idletasks()
+        # Several <Configure> events may arrive for one change of the
+        # table;  update the scroll region only once, when Tk is idle.
+        if self.configure_pending:
+            return
+        self.configure_pending = True
+        self.after_idle(self.update_scrollregion)
+
+    def update_scrollregion(self):
+        self.configure_pending = False
         self.mainarea.configure(scrollregion=self.mainarea.bbox('all'))
 
-    def check_failure(self, record, calc, value):
+    def failure_check(self, record, calc):
         #
         # record will be a list of <value> ['fail'|''] [<calc-type>]
         #
-        # Return on any condition that is not specified as a failure
+        # Return a function of a value that is True if the value fails
+        # the record, or None for any record that is not specified as a
+        # failure.  The target is only parsed once, not once per value,
+        # and the function also applies to a numpy array of values.
 
         if len(record) < 2 or record[1] != 'fail':
             return None
@@ -115,12 +201,10 @@ class FailReport(tkinter.Toplevel):
 
         if calc == 'minimum':
             targval = float(target)
-            if value < targval:
-                return True
+            return lambda value: value < targval
         elif calc == 'maximum':
             targval = float(target)
-            if value > targval:
-                return True
+            return lambda value: value > targval
         else:
             return None
 
@@ -128,33 +212,91 @@ class FailReport(tkinter.Toplevel):
     # the units of that condition.  If the condition isn't found in the local
     # parameters, then it is searched for in dsheet['global_conditions'].
 
+    # The units of all conditions are collected once per parameter (and
+    # display) into a dictionary.
+
     def findunit(self, condname, param, dsheet):
-        unit = ''
-        try:
-            loccond = next(
-                item
-                for item in param['conditions']
-                if item['name'] == condname
-            )
-        except StopIteration:
+        if self.unitparam is not param:
+            self.unitmap = {}
+            # Local conditions first, so that they take precedence
+            for item in param['conditions']:
+                self.unitmap.setdefault(item['name'], item.get('unit', ''))
             globcond = dsheet['default_conditions']
-            try:
-                globitem = next(
-                    item for item in globcond if item['name'] == condname
-                )
-            except (TypeError, StopIteration):
-                unit = ''  	# No units
+            for item in globcond or []:
+                self.unitmap.setdefault(item['name'], item.get('unit', ''))
+            self.unitparam = param
+        return self.unitmap.get(condname, '')  # No units if not found
+
+    def get_table(self, param):
+        # Return the condition names, units and rows of results of the
+        # parameter's testbenches.  The table is kept until the parameter
+        # has new testbench results.
+        testbenches = param['testbenches']
+        unit = param['unit']
+        key = param['name']
+        if key in self.tables:
+            cached, cachedunit, table = self.tables.pop(key)
+            if cached is testbenches and cachedunit == unit:
+                # The most recently used tables are kept last
+                self.tables[key] = (cached, cachedunit, table)
+                return table
+
+        # Rearrange testbench results;  this is due to legacy code and
+        # might work better to leave the testbench results in the existing
+        # format.
+
+        names = ['result']
+        units = [unit]
+        tblist = testbenches
+        if not isinstance(tblist, list):
+            tblist = [tblist]
+
+        # Assuming that the condition names and units are the same for
+        # all testbenches.
+        for condition in tblist[0]['conditions']:
+            names.append(condition[0])
+            if len(condition) == 3:
+                units.append(condition[1])
             else:
-                if 'unit' in globitem:
-                    unit = globitem['unit']
+                units.append('')
+
+        names.append('testbench')
+        units.append('')
+        results = []
+        warned = False
+
+        for testbench in tblist:
+            tresult = []
+            result = testbench['results']
+            # To do:  handle vector results here, which imply
+            # that conditions list needs to be expanded by variables.
+            # (Results may also be nested more than once.)  Only the
+            # first truncation is reported.
+            while isinstance(result, list):
+                if len(result) > 1 and not warned:
+                    print(
+                        'Warning: result truncated from length '
+                        + str(len(result))
+                    )
+                    warned = True
+                result = result[0]
+            tresult.append(result)
+
+            for condition in testbench['conditions']:
+                if len(condition) == 3:
+                    tresult.append(condition[2])
                 else:
-                    unit = ''  	# No units
-        else:
-            if 'unit' in loccond:
-                unit = loccond['unit']
-            else:
-                unit = ''  	# No units
-        return unit
+                    tresult.append(condition[1])
+            # Add the testbench filename as the last entry
+            tresult.append(os.path.split(testbench['filename'])[1])
+            results.append(tresult)
+
+        table = (names, units, results)
+        self.tables[key] = (testbenches, unit, table)
+        # Drop the least recently used tables
+        while len(self.tables) > maxtables:
+            self.tables.pop(next(iter(self.tables)))
+        return table
 
     def size_plotreport(self):
         self.update_idletasks()
@@ -185,13 +327,85 @@ class FailReport(tkinter.Toplevel):
         else:
             self.mainarea.configure(height=height)
 
+    def makeplot(self, dsheet, param, plotrec, callback):
+        # Make the plot 'plotrec' of param, and pass its canvas (or None
+        # if plotting failed) to callback.  The canvas made by an earlier
+        # call is reused if the parameter and its results are unchanged.
+        #
+        # The figure is made in a worker thread so that the window stays
+        # responsive;  only its Tk canvas is made in the main thread.
+        # Only the callback of the latest request is called.
+        self.plotrequest += 1
+        request = self.plotrequest
+
+        key = (param.get('name'), plotrec.get('xaxis'), plotrec.get('type'))
+        testbenches = param.get('testbenches')
+        if key in self.plots:
+            plotted, canvas = self.plots.pop(key)
+            if plotted is testbenches:
+                # The most recently used plots are kept last
+                self.plots[key] = (plotted, canvas)
+                callback(canvas)
+                return
+            # Results changed since the plot was made
+            canvas.get_tk_widget().destroy()
+
+        # Plot a copy of param with the 'plot' record, so that param
+        # itself is not changed while the worker runs.
+        plotparam = dict(param)
+        plotparam['plot'] = plotrec
+        future = self.plotexecutor.submit(make_figure, dsheet, plotparam)
+
+        busy = ttk.Label(
+            self.plotframe, text='Plotting…', style='italic.TLabel'
+        )
+        busy.grid(row=0, column=0)
+
+        def poll():
+            if not future.done():
+                self.after(50, poll)
+                return
+            if busy.winfo_exists():
+                busy.destroy()
+
+            try:
+                figure = future.result()
+            except Exception as error:
+                print(f'Failure to plot {key[0]}:  {error}')
+                figure = None
+
+            canvas = None
+            if figure:
+                canvas = FigureCanvasTkAgg(figure, master=self.plotframe)
+                # Draw when Tk is idle, not synchronously
+                canvas.draw_idle()
+                self.plots[key] = (testbenches, canvas)
+                # Drop the least recently used plots
+                while len(self.plots) > maxplots:
+                    _, oldcanvas = self.plots.pop(next(iter(self.plots)))
+                    oldcanvas.get_tk_widget().destroy()
+            if request == self.plotrequest:
+                callback(canvas)
+
+        poll()
+
+    def clear_plotframe(self):
+        # Hide the plots in the plot frame, and destroy everything else.
+        plotwidgets = [
+            canvas.get_tk_widget() for _, canvas in self.plots.values()
+        ]
+        for widget in self.plotframe.winfo_children():
+            if widget in plotwidgets:
+                widget.grid_remove()
+            else:
+                widget.destroy()
+
     def table_to_histogram(self, dsheet, filename):
         # Switch from a table view to a histogram plot view, using the
         # result as the X axis variable and count for the Y axis.
 
-        # Destroy existing contents.
-        for widget in self.plotframe.winfo_children():
-            widget.destroy()
+        # Clear existing contents.
+        self.clear_plotframe()
 
         param = self.data
         plotrec = {}
@@ -202,21 +416,20 @@ class FailReport(tkinter.Toplevel):
         if 'unit' in param:
             plotrec['xlabel'] += ' (' + param['unit'] + ')'
 
-        # Temporarily set a 'plot' record in param
-        param['plot'] = plotrec
-
         # faild = self.mainarea.faildisplay	# definition for convenience
         self.failframe.grid_forget()
         self.plotframe.grid(row=0, column=0, sticky='nsew')
-        canvas = cace_makeplot(dsheet, param, parent=self.plotframe)
-        param.pop('plot')
 
         if 'display' in param:
             ttk.Label(
                 self.plotframe, text=param['display'], style='title.TLabel'
             ).grid(row=1, column=0)
-        canvas.draw()
-        canvas.get_tk_widget().grid(row=0, column=0, sticky='nsew')
+
+        def show(canvas):
+            if canvas:
+                canvas.get_tk_widget().grid(row=0, column=0, sticky='nsew')
+
+        self.makeplot(dsheet, param, plotrec, show)
         # Finally, open the window if it was not already open.
         self.open()
 
@@ -224,9 +437,8 @@ class FailReport(tkinter.Toplevel):
         # Switch from a table view to a plot view, using the condname as
         # the X axis variable.
 
-        # Destroy existing contents.
-        for widget in self.plotframe.winfo_children():
-            widget.destroy()
+        # Clear existing contents.
+        self.clear_plotframe()
 
         dsheet = self.parent.parameter_manager.get_datasheet()
 
@@ -252,33 +464,30 @@ class FailReport(tkinter.Toplevel):
         self.failframe.grid_forget()
         self.plotframe.grid(row=0, column=0, sticky='nsew')
 
-        # Temporarily set a 'plot' record in param
-        param['plot'] = plotrec
-
-        canvas = cace_makeplot(dsheet, param, parent=self.plotframe)
-        param.pop('plot')
         if 'display' in param:
             ttk.Label(
                 self.plotframe, text=param['display'], style='title.TLabel'
             ).grid(row=1, column=0)
 
-        if canvas:
-            canvas.draw()
-            canvas.get_tk_widget().grid(row=0, column=0, sticky='nsew')
+        def show(canvas):
+            if canvas:
+                canvas.get_tk_widget().grid(row=0, column=0, sticky='nsew')
 
-            # Display the button to return to the table view
-            # except for transient and Monte Carlo simulations which are too large to tabulate.
-            if not condition == 'time':
-                self.bbar.table_button.grid(column=1, row=0, padx=5)
-                self.bbar.table_button.configure(
-                    command=lambda pname=pname: self.display(pname)
-                )
+                # Display the button to return to the table view
+                # except for transient and Monte Carlo simulations which are too large to tabulate.
+                if not condition == 'time':
+                    self.bbar.table_button.grid(column=1, row=0, padx=5)
+                    self.bbar.table_button.configure(
+                        command=lambda pname=pname: self.display(pname)
+                    )
 
-            # Finally, open the window if it was not already open.
-            self.open()
-        else:
-            # Plot failed;  revert to the table view
-            self.display(param, dsheet, filename)
+                # Finally, open the window if it was not already open.
+                self.open()
+            else:
+                # Plot failed;  revert to the table view
+                self.display(param, dsheet, filename)
+
+        self.makeplot(dsheet, param, plotrec, show)
 
     def display(self, pname=None):
         # (Diagnostic)
@@ -297,9 +506,13 @@ class FailReport(tkinter.Toplevel):
             'filename'
         )
 
-        # Destroy existing contents.
+        # Conditions may have changed since the last display
+        self.unitparam = None
+
+        # Destroy existing contents, except for the table body.
         for widget in self.mainarea.faildisplay.winfo_children():
-            widget.destroy()
+            if widget is not self.body:
+                widget.destroy()
 
         # 'param' is a dictionary pulled in from the annotate datasheet.
         # If the failure display was called, then 'param' should contain
@@ -311,16 +524,18 @@ class FailReport(tkinter.Toplevel):
             self.plotframe.grid(row=0, column=0, sticky='nsew')
 
             # Clear the plotframe and remake
-            for widget in self.plotframe.winfo_children():
-                widget.destroy()
+            self.clear_plotframe()
 
-            canvas = cace_makeplot(dsheet, param, parent=self.plotframe)
             if 'display' in param:
                 ttk.Label(
                     self.plotframe, text=param['display'], style='title.TLabel'
                 ).grid(row=1, column=0)
-            canvas.draw()
-            canvas.get_tk_widget().grid(row=0, column=0, sticky='nsew')
+
+            def show(canvas):
+                if canvas:
+                    canvas.get_tk_widget().grid(row=0, column=0, sticky='nsew')
+
+            self.makeplot(dsheet, param, param['plot'], show)
             self.data = param
             # Display the button to return to the table view
             self.bbar.table_button.grid(column=1, row=0, padx=5)
@@ -339,61 +554,7 @@ class FailReport(tkinter.Toplevel):
             self.plotframe.grid_forget()
             self.failframe.grid(column=0, row=0, sticky='nsew')
             faild = self.mainarea.faildisplay  	# definition for convenience
-            testbenches = param['testbenches']
-
-            # Rearrange testbench results;  this is due to legacy code and
-            # might work better to leave the testbench results in the existing
-            # format.
-
-            names = ['result']
-            units = [param['unit']]
-            if not isinstance(testbenches, list):
-                testbenches = [testbenches]
-
-            # Assuming that the condition names and units are the same for
-            # all testbenches.
-            for condition in testbenches[0]['conditions']:
-                names.append(condition[0])
-                if len(condition) == 3:
-                    units.append(condition[1])
-                else:
-                    units.append('')
-
-            names.append('testbench')
-            units.append('')
-            results = []
-
-            for testbench in testbenches:
-                tresult = []
-                result = testbench['results']
-                # To do:  handle vector results here, which imply
-                # that conditions list needs to be expanded by variables.
-                if isinstance(result, list):
-                    if len(result) > 1:
-                        print(
-                            'Warning: result truncated from length '
-                            + str(len(result))
-                        )
-                    result = result[0]
-
-                # Results get double-nested?
-                if isinstance(result, list):
-                    if len(result) > 1:
-                        print(
-                            'Warning: result truncated from length '
-                            + str(len(result))
-                        )
-                    result = result[0]
-                tresult.append(result)
-
-                for condition in testbench['conditions']:
-                    if len(condition) == 3:
-                        tresult.append(condition[2])
-                    else:
-                        tresult.append(condition[1])
-                # Add the testbench filename as the last entry
-                tresult.append(os.path.split(testbench['filename'])[1])
-                results.append(tresult)
+            names, units, results = self.get_table(param)
 
             # Check for transient simulation
             if 'time' in names:
@@ -416,95 +577,82 @@ class FailReport(tkinter.Toplevel):
                         return
 
             # Numerically sort by result (to be done:  sort according to up/down
-            # criteria, which will be retained per header entry)
+            # criteria, which will be retained per header entry).  Results are
+            # converted to float once, and the values are kept for scaling.
             try:
-                results.sort(
-                    key=lambda row: float(row[0]), reverse=self.sortdir
-                )
-            except:
+                values = [float(row[0]) for row in results]
+            except (ValueError, TypeError):
                 print('Failure to sort results:  results = ' + str(results))
-
-            # To get ranges, transpose the results matrix, then make unique
-            ranges = list(map(list, zip(*results)))[0:-1]
-            for r, vrange in enumerate(ranges):
+                raise
+            order = sorted(
+                range(len(results)),
+                key=values.__getitem__,
+                reverse=self.sortdir,
+            )
+            results = [results[i] for i in order]
+            values = [values[i] for i in order]
+
+            # To get ranges, take the minimum and maximum of each column of
+            # the results matrix, or its unique values if not numeric.
+            # Columns are read one at a time, without a transposed copy of
+            # the whole matrix.
+            ranges = []
+            for c in range(len(names) - 1):
                 try:
-                    vmin = min(float(v) for v in vrange)
-                    vmax = max(float(v) for v in vrange)
-                    if vmin == vmax:
-                        ranges[r] = [str(vmin)]
-                    else:
-                        ranges[r] = [str(vmin), str(vmax)]
-                except ValueError:
-                    ranges[r] = list(set(vrange))
-                    pass
+                    colvalues = numpy.fromiter(
+                        (row[c] for row in results),
+                        numpy.float64,
+                        count=len(results),
+                    )
+                except (ValueError, TypeError):
+                    column = [row[c] for row in results]
+                    try:
+                        ranges.append(numpy.unique(column).tolist())
+                    except TypeError:
+                        ranges.append(list(set(column)))
+                    continue
+                vmin = float(colvalues.min())
+                vmax = float(colvalues.max())
+                if vmin == vmax:
+                    ranges.append([str(vmin)])
+                else:
+                    ranges.append([str(vmin), str(vmax)])
             # For testbench names, just use the testbench number as the range.
             ranges.append(['1', str(len(results))])
 
+            # Do not update the scroll region for every widget added to the
+            # table, only once when the table is complete.
+            faild.unbind('<Configure>')
+
             faild.titlebar = ttk.Frame(faild)
             faild.titlebar.grid(row=0, column=0, sticky='ewns')
 
-            faild.titlebar.label1 = ttk.Label(
-                faild.titlebar,
-                text='Electrical Parameter: ',
-                style='italic.TLabel',
-            )
-            faild.titlebar.label1.pack(side='left', padx=6, ipadx=3)
-            if 'display' in param:
-                faild.titlebar.label2 = ttk.Label(
-                    faild.titlebar,
-                    text=param['display'],
-                    style='normal.TLabel',
-                )
-                faild.titlebar.label2.pack(side='left', padx=6, ipadx=3)
-                faild.titlebar.label3 = ttk.Label(
-                    faild.titlebar, text='  Testbench: ', style='italic.TLabel'
-                )
-                faild.titlebar.label3.pack(side='left', padx=6, ipadx=3)
-            simulate = param['simulate']
-            faild.titlebar.label4 = ttk.Label(
-                faild.titlebar,
-                text=simulate['template'],
-                style='normal.TLabel',
-            )
-            faild.titlebar.label4.pack(side='left', padx=6, ipadx=3)
-
             if 'spec' in param:
                 spec = param['spec']
             else:
                 spec = {}
 
+            # Title bar entries of (text, style, padx)
+            titles = [('Electrical Parameter: ', 'italic.TLabel', 6)]
+            if 'display' in param:
+                titles.append((param['display'], 'normal.TLabel', 6))
+                titles.append(('  Testbench: ', 'italic.TLabel', 6))
+            titles.append((param['simulate']['template'], 'normal.TLabel', 6))
             if 'minimum' in spec:
-                faild.titlebar.label7 = ttk.Label(
-                    faild.titlebar, text='  Min Limit: ', style='italic.TLabel'
-                )
-                faild.titlebar.label7.pack(side='left', padx=3, ipadx=3)
-                faild.titlebar.label8 = ttk.Label(
-                    faild.titlebar, text=spec['minimum'], style='normal.TLabel'
-                )
-                faild.titlebar.label8.pack(side='left', padx=6, ipadx=3)
+                titles.append(('  Min Limit: ', 'italic.TLabel', 3))
+                titles.append((spec['minimum'], 'normal.TLabel', 6))
                 if 'unit' in param:
-                    faild.titlebar.label9 = ttk.Label(
-                        faild.titlebar,
-                        text=param['unit'],
-                        style='italic.TLabel',
-                    )
-                    faild.titlebar.label9.pack(side='left', padx=3, ipadx=3)
+                    titles.append((param['unit'], 'italic.TLabel', 3))
             if 'maximum' in spec:
-                faild.titlebar.label10 = ttk.Label(
-                    faild.titlebar, text='  Max Limit: ', style='italic.TLabel'
-                )
-                faild.titlebar.label10.pack(side='left', padx=6, ipadx=3)
-                faild.titlebar.label11 = ttk.Label(
-                    faild.titlebar, text=spec['maximum'], style='normal.TLabel'
-                )
-                faild.titlebar.label11.pack(side='left', padx=6, ipadx=3)
+                titles.append(('  Max Limit: ', 'italic.TLabel', 6))
+                titles.append((spec['maximum'], 'normal.TLabel', 6))
                 if 'unit' in param:
-                    faild.titlebar.label12 = ttk.Label(
-                        faild.titlebar,
-                        text=param['unit'],
-                        style='italic.TLabel',
-                    )
-                    faild.titlebar.label12.pack(side='left', padx=3, ipadx=3)
+                    titles.append((param['unit'], 'italic.TLabel', 3))
+
+            for text, style, padx in titles:
+                ttk.Label(faild.titlebar, text=text, style=style).pack(
+                    side='left', padx=padx, ipadx=3
+                )
 
             # Simplify view by removing constant values from the table and just listing them
             # on the second line.
@@ -530,9 +678,17 @@ class FailReport(tkinter.Toplevel):
                     ).grid(row=row, column=col, padx=6, sticky='nsew')
                     j += 1
 
-            body = ttk.Frame(faild, style='bg.TFrame')
+            if self.body is None:
+                self.body = ttk.Frame(faild, style='bg.TFrame')
+            body = self.body
             body.grid(row=2, column=0, sticky='ewns')
 
+            # Destroy the existing column headers
+            for header in self.headers:
+                header.destroy()
+            self.headers = []
+            self.sortheader = None
+
             # Print out names
             j = 0
             for condname, unit, drange in zip(names, units, ranges):
@@ -556,6 +712,7 @@ class FailReport(tkinter.Toplevel):
                         command=lambda pname=pname: self.changesort(pname),
                     )
                     ToolTip(header, text='Reverse order of results')
+                    self.sortheader = (header, condname)
                 elif labtext == 'testbench':
                     header = ttk.Label(
                         body,
@@ -575,7 +732,8 @@ class FailReport(tkinter.Toplevel):
                         header,
                         text='Plot results with this condition on the X axis',
                     )
-                header.grid(row=0, column=j, sticky='ewns')
+                header.grid(row=0, column=j, sticky='ewns', **cellpadding)
+                self.headers.append(header)
 
                 # Second row is the measurement unit
                 # if j == 0:
@@ -590,50 +748,57 @@ class FailReport(tkinter.Toplevel):
                 #     unit = self.findunit(condname, param, dsheet)
 
                 unitlabel = ttk.Label(body, text=unit, style='brown.TLabel')
-                unitlabel.grid(row=1, column=j, sticky='ewns')
+                unitlabel.grid(row=1, column=j, sticky='ewns', **cellpadding)
+                self.headers.append(unitlabel)
 
                 # (Pick up limits when all entries have been processed---see below)
                 j += 1
 
             # Now list entries for each failure record.  These should all be in the
-            # same order.
-            m = 2
-            for result in results:
-                m += 1
-                j = 0
-                condition = result[0]
-                lstyle = 'normal.TLabel'
-                value = float(condition)
-
-                # scaled_value is 'value' scaled to the units used by param.
-                if 'unit' in param:
-                    scaled_value = spice_unit_unconvert([param['unit'], value])
-                else:
-                    scaled_value = value
-
-                if 'minimum' in spec:
-                    minrec = spec['minimum']
-                    calc = minrec[2] if len(minrec) > 2 else 'minimum'
-                    if self.check_failure(minrec, calc, scaled_value):
-                        lstyle = 'red.TLabel'
-                if 'maximum' in spec:
-                    maxrec = spec['maximum']
-                    calc = maxrec[2] if len(maxrec) > 2 else 'maximum'
-                    if self.check_failure(maxrec, calc, scaled_value):
-                        lstyle = 'red.TLabel'
-
-                for condition, drange in zip(result, ranges):
-                    if len(drange) > 1:
-                        if j == 0:
-                            pname = ttk.Label(
-                                body, text=str(scaled_value), style=lstyle
-                            )
-                        else:
-                            pname = ttk.Label(
-                                body, text=condition, style=lstyle
-                            )
-                        pname.grid(row=m, column=j, sticky='ewns')
-                        j += 1
+            # same order.  Only columns that are not constant are shown.
+            columns = [c for c, drange in enumerate(ranges) if len(drange) > 1]
+            rows = []
+
+            # scaled_values are the result values scaled to the units used
+            # by param.  Convert all of them at once.
+            if 'unit' in param:
+                scaled_values = spice_unit_unconvert([param['unit'], values])
+            else:
+                scaled_values = values
+
+            # Checks of the limits that are specified as failures
+            checks = []
+            if 'minimum' in spec:
+                minrec = spec['minimum']
+                calc = minrec[2] if len(minrec) > 2 else 'minimum'
+                checks.append(self.failure_check(minrec, calc))
+            if 'maximum' in spec:
+                maxrec = spec['maximum']
+                calc = maxrec[2] if len(maxrec) > 2 else 'maximum'
+                checks.append(self.failure_check(maxrec, calc))
+            checks = [check for check in checks if check]
+
+            # Apply the checks to all results at once
+            failed = numpy.zeros(len(scaled_values), dtype=bool)
+            if checks:
+                scaled = numpy.asarray(scaled_values, dtype=numpy.float64)
+                for check in checks:
+                    failed |= check(scaled)
+
+            # The first column (the result) shows the scaled value, so it
+            # is handled apart from the conditions.
+            showvalue = 0 in columns
+            condcolumns = [c for c in columns if c > 0]
+
+            for result, scaled_value, fail in zip(
+                results, scaled_values, failed
+            ):
+                lstyle = 'red.TLabel' if fail else 'normal.TLabel'
+
+                texts = [result[c] for c in condcolumns]
+                if showvalue:
+                    texts.insert(0, str(scaled_value))
+                rows.append((texts, lstyle))
 
             # Row 2 contains the ranges of each column
             j = 1
@@ -641,43 +806,193 @@ class FailReport(tkinter.Toplevel):
             for vrange in ranges[1:]:
                 if len(vrange) > 1:
 
-                    condlimits = '( '
-
                     # This is a bit of a hack;  results are assumed floating-point
                     # unless they can't be resolved as a number.  So numerical values
                     # that should be treated as integers or strings must be handled
                     # here according to the condition type.
                     if names[k].split(':')[0] == 'DIGITAL':
-                        for l in vrange:
-                            condlimits += str(int(float(l))) + ' '
+                        limits = [str(int(float(l))) for l in vrange]
                     else:
-                        for l in vrange:
-                            condlimits += l + ' '
-                    condlimits += ')'
+                        limits = vrange
+                    condlimits = '( ' + ' '.join(limits) + ' )'
                     header = ttk.Label(
                         body, text=condlimits, style='blue.TLabel'
                     )
-                    header.grid(row=2, column=j, sticky='ewns')
+                    header.grid(row=2, column=j, sticky='ewns', **cellpadding)
+                    self.headers.append(header)
                     j += 1
 
                 k += 1
 
-            # Add padding around widgets in the body of the failure report, so that
-            # the frame background comes through, making a grid.
-            for child in body.winfo_children():
-                child.grid_configure(ipadx=5, ipady=1, padx=2, pady=2)
+            # Show the results.  Rows are only given cells when in view.
+            self.rows = rows
+            self.rowvalues = values
+            self.layout_rows(len(columns))
 
-            # Resize the window to fit in the display, if necessary.
+            # Resize the window to fit in the display, if necessary.  This
+            # does the only geometry update of the table.
             self.size_failreport()
+            self.mainarea.configure(scrollregion=self.mainarea.bbox('all'))
+            faild.bind('<Configure>', self.frame_configure)
+            self.refresh_grid(force=True)
 
         # Don't put the button at the bottom to return to table view.
         self.bbar.table_button.grid_forget()
         # Finally, open the window if it was not already open.
         self.open()
 
+    def build_grid(self, nrows, ncols):
+        # Show a grid of nrows x ncols result cells in the table body,
+        # below the three header rows.  The pool of cells is only grown
+        # when needed, and cells outside the grid are hidden, not destroyed.
+        oldrows, oldcols = self.gridshape
+        for m in range(max(nrows, len(self.cells))):
+            if m == len(self.cells):
+                self.cells.append([])
+                self.cellstyles.append('normal.TLabel')
+            cellrow = self.cells[m]
+            lastcol = max(ncols, len(cellrow)) if m < nrows else len(cellrow)
+            for j in range(lastcol):
+                if j == len(cellrow):
+                    if j > 0:
+                        # Row style must be set for the new cell
+                        self.cellstyles[m] = None
+                    cell = ttk.Label(self.body, style='normal.TLabel')
+                    cell.grid(
+                        row=m + 3, column=j, sticky='ewns', **cellpadding
+                    )
+                    cellrow.append(cell)
+                    shown = True
+                else:
+                    shown = m < oldrows and j < oldcols
+                if m < nrows and j < ncols:
+                    if not shown:
+                        cellrow[j].grid()
+                elif shown:
+                    cellrow[j].grid_remove()
+        self.gridshape = (nrows, ncols)
+
+    def slot_count(self):
+        # Number of rows of cells needed to fill the table view.  Before
+        # the view is mapped, assume its largest size (see size_failreport)
+        if not self.rowpitch:
+            return 2 * overscan
+        height = self.mainarea.winfo_height()
+        if height <= 1:
+            height = self.root.winfo_screenheight() - 120
+        return height // self.rowpitch + 1 + 2 * overscan
+
+    def layout_rows(self, ncols):
+        # Give all rows of results the same height, and each column the
+        # width of its widest entry, so that rows without cells still
+        # take up space and the table does not change shape when rows
+        # are scrolled into view.
+        body = self.body
+        nrows = len(self.rows)
+        self.build_grid(min(nrows, self.slot_count()), ncols)
+        self.refresh_grid(force=True)
+
+        font = self.get_cellfont()
+
+        # Row height, including padding (see build_grid()).  The requested
+        # height of a cell is known without waiting for the geometry update.
+        pitch = font.metrics('linespace')
+        if self.cells:
+            pitch = max(pitch, self.cells[0][0].winfo_reqheight())
+        pitch += 6
+        if self.tablerows > nrows:
+            body.rowconfigure(
+                tuple(range(nrows + 3, self.tablerows + 3)), minsize=0
+            )
+        if nrows:
+            body.rowconfigure(tuple(range(3, nrows + 3)), minsize=pitch)
+        self.tablerows = nrows
+        self.rowpitch = pitch
+
+        # Now that the row height is known, make enough cells to fill
+        # the view.
+        self.build_grid(min(nrows, self.slot_count()), ncols)
+
+        if self.tablecols > ncols:
+            body.columnconfigure(
+                tuple(range(ncols, self.tablecols)), minsize=0
+            )
+        for j in range(ncols):
+            texts = (str(row[0][j]) for row in self.rows)
+            widest = max(texts, key=len, default='')
+            # Text width plus padding (see build_grid())
+            body.columnconfigure(j, minsize=font.measure(widest) + 18)
+        self.tablecols = ncols
+
+    def get_cellfont(self):
+        # The font of the result cells, for measuring text
+        if not self.cellfont:
+            fontname = ttk.Style().lookup('normal.TLabel', 'font')
+            if fontname:
+                self.cellfont = tkinter.font.Font(font=fontname)
+            else:
+                self.cellfont = tkinter.font.nametofont('TkDefaultFont')
+        return self.cellfont
+
+    def refresh_grid(self, force=False):
+        # Move the pool of cells to the rows of results that are in view
+        # (plus a margin of overscan rows), and set their text and style.
+        if not self.rows or not self.cells:
+            return
+        # Add cells if the view has grown
+        nslots = min(len(self.rows), self.slot_count())
+        if nslots > self.gridshape[0]:
+            self.build_grid(nslots, self.gridshape[1])
+            force = True
+        nslots = min(len(self.rows), self.gridshape[0])
+        if self.rowpitch:
+            ytop = self.mainarea.canvasy(0) - self.body.winfo_y()
+            bbox = self.body.grid_bbox(0, 3)
+            first = int((ytop - bbox[1]) // self.rowpitch) - overscan
+            first = max(0, min(first, len(self.rows) - nslots))
+        else:
+            first = 0
+        if first == self.firstrow and not force:
+            return
+        self.firstrow = first
+
+        # Cells only have their style changed if it differs from the
+        # style of the row they showed before.
+        for i, cellrow in enumerate(self.cells[:nslots]):
+            m = first + i
+            texts, style = self.rows[m]
+            if style == self.cellstyles[i]:
+                for cell, text in zip(cellrow, texts):
+                    cell.configure(text=text)
+                    cell.grid_configure(row=m + 3)
+            else:
+                for cell, text in zip(cellrow, texts):
+                    cell.configure(text=text, style=style)
+                    cell.grid_configure(row=m + 3)
+                self.cellstyles[i] = style
+
     def changesort(self, pname):
         self.sortdir = False if self.sortdir == True else True
-        self.display(pname)
+
+        # Only the order of the rows changes, so if the table is shown,
+        # reorder its rows instead of making the whole table again.
+        if not self.rows or not self.sortheader:
+            self.display(pname)
+            return
+
+        order = sorted(
+            range(len(self.rows)),
+            key=self.rowvalues.__getitem__,
+            reverse=self.sortdir,
+        )
+        self.rows = [self.rows[i] for i in order]
+        self.rowvalues = [self.rowvalues[i] for i in order]
+
+        header, condname = self.sortheader
+        header.configure(
+            text=condname + (' \u21e9' if self.sortdir else ' \u21e7')
+        )
+        self.refresh_grid(force=True)
 
     def close(self):
         # pop down failure report window
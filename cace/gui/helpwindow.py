@@ -10,7 +10,6 @@
 # Version 0.1
 # --------------------------------------------------------
 
-import re
 import webbrowser
 import tkinter
 from tkinter import ttk
@@ -20,16 +19,22 @@ from ..__version__ import __version__
 
 
 class LinkButton(ttk.Button):
+    # Font shared by all link buttons, made with the first one
+    link_font = None
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-        # Use the default font.
-        label_font = nametofont('TkDefaultFont').cget('family')
-        self.font = Font(family=label_font, size=9)
+        if LinkButton.link_font is None:
+            # Use the default font.
+            label_font = nametofont('TkDefaultFont').cget('family')
+            LinkButton.link_font = Font(family=label_font, size=9)
+
+            # Label-like styling.
+            style = ttk.Style()
+            style.configure('Link.TLabel', foreground='#357fde')
 
-        # Label-like styling.
-        style = ttk.Style()
-        style.configure('Link.TLabel', foreground='#357fde')
+        self.font = LinkButton.link_font
         self.configure(style='Link.TLabel', cursor='hand2')
         self.bind('<Enter>', self.on_mouse_enter)
         self.bind('<Leave>', self.on_mouse_leave)
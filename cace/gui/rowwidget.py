@@ -13,13 +13,71 @@
 # limitations under the License.
 
 import os
-import re
+import functools
 import tkinter
 from tkinter import ttk
 
 from .tooltip import *
 
-binrex = re.compile(r'([0-9]*)\'([bodh])', re.IGNORECASE)
+# Kind of status shown for each tool.  Tools not listed here have the
+# status button disabled.
+toolkinds = {
+    'ngspice': 'ngspice',
+    'netgen_lvs': 'lvs',
+    'cace_lvs': 'lvs',
+    'magic_area': 'area',
+    'cace_area': 'area',
+    'magic_drc': 'drc',
+    'cace_drc': 'drc',
+}
+
+# Styles of the labels and buttons of a row:  normal, red and green
+# labels, then normal, red and green buttons.  Editable parameters are
+# highlighted.
+rowstyles = {
+    False: (
+        'normal.TLabel',
+        'red.TLabel',
+        'green.TLabel',
+        'normal.TButton',
+        'red.TButton',
+        'green.TButton',
+    ),
+    True: (
+        'hlight.TLabel',
+        'rhlight.TLabel',
+        'ghlight.TLabel',
+        'hlight.TButton',
+        'rhlight.TButton',
+        'ghlight.TButton',
+    ),
+}
+
+# Padding around the widgets of a row, so that the frame background
+# comes through, making a grid.  It is given when the widgets are gridded.
+cellpadding = {'ipadx': 5, 'ipady': 1, 'padx': 2, 'pady': 2}
+
+
+# Binding tag of row widgets that get their tooltip when first entered,
+# see RowWidget.add_tooltip()
+tooltiptag = 'RowWidgetToolTip'
+
+
+def enter_tooltip(event):
+    # Create the tooltip of a row widget the first time it is entered
+    widget = event.widget
+    if getattr(widget, 'tooltip', None) is None:
+        widget.tooltip = ToolTip(widget, text=widget.tooltip_text)
+        widget.tooltip.enter()
+
+
+@functools.lru_cache(maxsize=128)
+def is_binary_unit(unit):
+    # Return True if the unit is a binary, octal, decimal or hex value
+    # (e.g., 4'b):  optional digits, a quote and one of b, o, d or h.
+    # Most parameters share a few units, so the results are kept.
+    base = unit.lstrip('0123456789')
+    return base[:1] == "'" and base[1:2].lower() in ('b', 'o', 'd', 'h')
 
 
 class RowWidget:
@@ -38,8 +96,23 @@ class RowWidget:
     simulate_widget = None
 
     paramtype = None
+    toolname = None
+    toolkind = None
+    specdict = None
+    unitsuffix = ''
     is_plot = None
 
+    # Whether the tooltip binding tag is bound, see add_tooltip()
+    tooltips_bound = False
+
+    # Options last given to each widget, see configure_widget()
+    applied = None
+
+    # Results of the parameter by netlist source, and their values, see
+    # get_results()
+    sourceresults = None
+    resultcache = None
+
     normlabel = 'normal.TLabel'
     redlabel = 'red.TLabel'
     greenlabel = 'green.TLabel'
@@ -51,12 +124,23 @@ class RowWidget:
 
         self.parameter_manager = parameter_manager
         self.netlist_source = netlist_source
+        self.dframe = dframe
+        self.row = row
 
         # Set the new parameter
         self.update_param(param)
 
-        # Create widgets accordingly
-        self.create_widgets(dframe, row)
+        # Widgets are created when realize() is called
+
+    def realize(self):
+
+        # Create widgets accordingly, if not done yet
+        if self.parameter_widget is None:
+            self.create_widgets(self.dframe, self.row)
+
+    def is_realized(self):
+
+        return self.parameter_widget is not None
 
     def set_functions(
         self, start, stop, edit, copy, delete, failreport, textreport
@@ -75,20 +159,27 @@ class RowWidget:
         self.param = param
         pname = self.param['name']
 
-        if 'editable' in self.param and self.param['editable'] == True:
-            self.normlabel = 'hlight.TLabel'
-            self.redlabel = 'rhlight.TLabel'
-            self.greenlabel = 'ghlight.TLabel'
-            self.normbutton = 'hlight.TButton'
-            self.redbutton = 'rhlight.TButton'
-            self.greenbutton = 'ghlight.TButton'
-        else:
-            self.normlabel = 'normal.TLabel'
-            self.redlabel = 'red.TLabel'
-            self.greenlabel = 'green.TLabel'
-            self.normbutton = 'normal.TButton'
-            self.redbutton = 'red.TButton'
-            self.greenbutton = 'green.TButton'
+        # Results are looked up again for the new parameter
+        self.sourceresults = {}
+        self.resultcache = {}
+
+        if 'results' in self.param and self.param['results']:
+            resultlist = self.param['results']
+            if not isinstance(resultlist, list):
+                resultlist = [resultlist]
+
+            for resultdict in resultlist:
+                self.sourceresults.setdefault(resultdict['name'], resultdict)
+
+        editable = 'editable' in self.param and self.param['editable'] == True
+        (
+            self.normlabel,
+            self.redlabel,
+            self.greenlabel,
+            self.normbutton,
+            self.redbutton,
+            self.greenbutton,
+        ) = rowstyles[editable]
 
         # Electrical parameter information
         if 'simulate' in self.param:
@@ -100,6 +191,27 @@ class RowWidget:
             self.paramtype = None
             print(f'Parameter {pname} unknown type.')
 
+        # Get the name of the tool
+        tool = self.param['tool']
+        if isinstance(tool, str):
+            self.toolname = tool
+        else:
+            self.toolname = next(iter(tool))
+        self.toolkind = toolkinds.get(self.toolname, 'other')
+
+        # Grab the electrical parameter's 'spec' dictionary
+        if 'spec' in self.param:
+            self.specdict = self.param['spec']
+        else:
+            self.specdict = {}
+
+        # Unit appended to limits and values.  Binary, octal, decimal or
+        # hex values are shown without one.
+        if 'unit' in self.param and not is_binary_unit(self.param['unit']):
+            self.unitsuffix = ' ' + self.param['unit']
+        else:
+            self.unitsuffix = ''
+
         if 'plot' in param:
             self.is_plot = True
         else:
@@ -114,15 +226,8 @@ class RowWidget:
 
     def tool_text(self):
 
-        tool = self.param['tool']
-
-        # Get the name of the tool
-        if isinstance(tool, str):
-            toolname = tool
-        else:
-            toolname = list(tool.keys())[0]
-
-        return toolname
+        # The name of the tool is found by update_param()
+        return self.toolname
 
     def plot_text(self):
 
@@ -148,27 +253,11 @@ class RowWidget:
                 if 'status' in resdict:
                     status_value = resdict['status']
         else:
-            # Grab the electrical parameter's 'spec' dictionary
-            if 'spec' in self.param:
-                specdict = self.param['spec']
-            else:
-                specdict = {}
+            for limit in ('minimum', 'typical', 'maximum'):
+                if limit not in self.specdict:
+                    continue
 
-            if 'minimum' in specdict:
-                (value, score) = self.get_min_results()
-
-                if score:
-                    if score != 'fail':
-                        if status_value != 'fail':
-                            status_value = 'pass'
-                    else:
-                        status_value = 'fail'
-                if value:
-                    if value == 'failure' or value == 'fail':
-                        status_value = '(not checked)'
-
-            if 'typical' in specdict:
-                (value, score) = self.get_typ_results()
+                (value, score) = self.get_results(limit)
 
                 if score:
                     # Note:  You can't fail a "typ" score, but there is only one "Status",
@@ -178,19 +267,8 @@ class RowWidget:
                             status_value = 'pass'
                     else:
                         status_value = 'fail'
-                if value:
-                    if value == 'failure' or value == 'fail':
-                        status_value = '(not checked)'
-
-            if 'maximum' in specdict:
-                (value, score) = self.get_max_results()
-
-                if score:
-                    if score != 'fail':
-                        if status_value != 'fail':
-                            status_value = 'pass'
-                    else:
-                        status_value = 'fail'
+                # A failed simulation of any limit leaves the status
+                # unchecked, so all limits are looked at even after a "fail".
                 if value:
                     if value == 'failure' or value == 'fail':
                         status_value = '(not checked)'
@@ -206,51 +284,39 @@ class RowWidget:
     def get_resultdict(self):
 
         # Return resultdict depending on source
-        if 'results' in self.param and self.param['results']:
-            resultlist = self.param['results']
-            if not isinstance(resultlist, list):
-                resultlist = [resultlist]
+        return self.sourceresults.get(self.netlist_source, {})
 
-            for resultdict in resultlist:
-                if resultdict['name'] == self.netlist_source:
-                    return resultdict
+    def get_results(self, limit):
+        # Return the (value, score) of the result for the limit
+        # ('minimum', 'typical' or 'maximum').  The results of all
+        # limits are found together and kept until update_param() is
+        # called.
+        if 'limits' not in self.resultcache:
+            specdict = self.specdict
+            resultdict = self.get_resultdict()
 
-        return {}
+            limits = {}
+            for name in ('minimum', 'typical', 'maximum'):
+                value = None
+                score = None
 
-    def get_min_results(self):
-        # Grab the electrical parameter's 'spec' dictionary
-        if 'spec' in self.param:
-            specdict = self.param['spec']
-        else:
-            specdict = {}
+                if name in specdict and name in resultdict:
+                    value = resultdict[name]
+                    if isinstance(value, list):
+                        score = value[1]
+                        value = value[0]
 
-        resultdict = self.get_resultdict()
+                limits[name] = (value, score)
 
-        value = None
-        score = None
+            self.resultcache['limits'] = limits
 
-        if 'minimum' in specdict:
-            pmin = specdict['minimum']
-            if isinstance(pmin, list):
-                penalty = pmin[1]
-                pmin = pmin[0]
-            else:
-                penalty = None
-
-            if 'minimum' in resultdict:
-                value = resultdict['minimum']
-                if isinstance(value, list):
-                    score = value[1]
-                    value = value[0]
+        return self.resultcache['limits'][limit]
 
-        return (value, score)
+    def get_min_results(self):
+        return self.get_results('minimum')
 
     def min_limit_text(self):
-        # Grab the electrical parameter's 'spec' dictionary
-        if 'spec' in self.param:
-            specdict = self.param['spec']
-        else:
-            specdict = {}
+        specdict = self.specdict
 
         # Fill in information for the spec minimum and result
         min_limit = '(no limit)'
@@ -259,12 +325,7 @@ class RowWidget:
             pmin = specdict['minimum']['value']
 
             if pmin != 'any':
-                if 'unit' in self.param and not binrex.match(
-                    self.param['unit']
-                ):
-                    targettext = f'{pmin} {self.param["unit"]}'
-                else:
-                    targettext = str(pmin)
+                targettext = f'{pmin}{self.unitsuffix}'
                 min_limit = targettext
 
         return min_limit
@@ -286,48 +347,17 @@ class RowWidget:
             if value == 'failure' or value == 'fail':
                 valuetext = value
                 min_status_style = self.redlabel
-            elif 'unit' in self.param and not binrex.match(self.param['unit']):
-                valuetext = value + ' ' + self.param['unit']
             else:
-                valuetext = value
+                valuetext = value + self.unitsuffix
             min_value = valuetext
 
         return (min_value, min_status_style)
 
     def get_typ_results(self):
-        # Grab the electrical parameter's 'spec' dictionary
-        if 'spec' in self.param:
-            specdict = self.param['spec']
-        else:
-            specdict = {}
-
-        resultdict = self.get_resultdict()
-
-        value = None
-        score = None
-
-        if 'typical' in specdict:
-            ptyp = specdict['typical']
-            if isinstance(ptyp, list):
-                penalty = ptyp[1]
-                ptyp = ptyp[0]
-            else:
-                penalty = None
-
-            if 'typical' in resultdict:
-                value = resultdict['typical']
-                if isinstance(value, list):
-                    score = value[1]
-                    value = value[0]
-
-        return (value, score)
+        return self.get_results('typical')
 
     def typ_limit_text(self):
-        # Grab the electrical parameter's 'spec' dictionary
-        if 'spec' in self.param:
-            specdict = self.param['spec']
-        else:
-            specdict = {}
+        specdict = self.specdict
 
         # Fill in information for the spec minimum and result
         typ_limit = '(no target)'
@@ -336,12 +366,7 @@ class RowWidget:
             ptyp = specdict['typical']['value']
 
             if ptyp != 'any':
-                if 'unit' in self.param and not binrex.match(
-                    self.param['unit']
-                ):
-                    targettext = f'{ptyp} {self.param["unit"]}'
-                else:
-                    targettext = str(ptyp)
+                targettext = f'{ptyp}{self.unitsuffix}'
                 typ_limit = targettext
 
         return typ_limit
@@ -363,48 +388,17 @@ class RowWidget:
             if value == 'failure' or value == 'fail':
                 valuetext = value
                 typ_status_style = self.redlabel
-            elif 'unit' in self.param and not binrex.match(self.param['unit']):
-                valuetext = value + ' ' + self.param['unit']
             else:
-                valuetext = value
+                valuetext = value + self.unitsuffix
             typ_value = valuetext
 
         return (typ_value, typ_status_style)
 
     def get_max_results(self):
-        # Grab the electrical parameter's 'spec' dictionary
-        if 'spec' in self.param:
-            specdict = self.param['spec']
-        else:
-            specdict = {}
-
-        resultdict = self.get_resultdict()
-
-        value = None
-        score = None
-
-        if 'maximum' in specdict:
-            pmax = specdict['maximum']
-            if isinstance(pmax, list):
-                penalty = pmax[1]
-                pmax = pmax[0]
-            else:
-                penalty = None
-
-            if 'maximum' in resultdict:
-                value = resultdict['maximum']
-                if isinstance(value, list):
-                    score = value[1]
-                    value = value[0]
-
-        return (value, score)
+        return self.get_results('maximum')
 
     def max_limit_text(self):
-        # Grab the electrical parameter's 'spec' dictionary
-        if 'spec' in self.param:
-            specdict = self.param['spec']
-        else:
-            specdict = {}
+        specdict = self.specdict
 
         # Fill in information for the spec minimum and result
         max_limit = '(no limit)'
@@ -413,12 +407,7 @@ class RowWidget:
             pmax = specdict['maximum']['value']
 
             if pmax != 'any':
-                if 'unit' in self.param and not binrex.match(
-                    self.param['unit']
-                ):
-                    targettext = f'{pmax} {self.param["unit"]}'
-                else:
-                    targettext = str(pmax)
+                targettext = f'{pmax}{self.unitsuffix}'
                 max_limit = targettext
 
         return max_limit
@@ -440,10 +429,8 @@ class RowWidget:
             if value == 'failure' or value == 'fail':
                 valuetext = value
                 max_status_style = self.redlabel
-            elif 'unit' in self.param and not binrex.match(self.param['unit']):
-                valuetext = value + ' ' + self.param['unit']
             else:
-                valuetext = value
+                valuetext = value + self.unitsuffix
             max_value = valuetext
 
         return (max_value, max_status_style)
@@ -460,21 +447,70 @@ class RowWidget:
 
         return simtext
 
+    def fill_simmenu(self, simmenu):
+
+        pname = self.param['name']
+
+        # Generate pull-down menu on Simulate button.  Most items apply
+        # only to electrical parameters (at least for now)
+        simmenu.delete(0, 'end')
+        simmenu.add_command(
+            label='Run',
+            command=functools.partial(self.fnc_start, pname),
+        )
+        simmenu.add_command(
+            label='Stop',
+            command=functools.partial(self.fnc_stop, pname),
+        )
+        if self.paramtype == 'electrical':
+            # simmenu.add_command(label='Hints',
+            # 	command = lambda param=param, simbutton=simbutton: self.add_hints(param, simbutton))
+            simmenu.add_command(
+                label='Edit',
+                command=functools.partial(self.fnc_edit, pname),
+            )
+            simmenu.add_command(
+                label='Copy',
+                command=functools.partial(self.fnc_copy, pname),
+            )
+            if 'editable' in self.param and self.param['editable'] == True:
+                simmenu.add_command(
+                    label='Delete',
+                    command=functools.partial(self.fnc_delete, pname),
+                )
+
+    def add_tooltip(self, widget, text):
+
+        # Most rows are never hovered, so the ToolTip (with its bindings)
+        # is only created when the pointer first enters the widget.
+        if not RowWidget.tooltips_bound:
+            widget.bind_class(tooltiptag, '<Enter>', enter_tooltip)
+            RowWidget.tooltips_bound = True
+
+        widget.tooltip_text = text
+        widget.bindtags(widget.bindtags() + (tooltiptag,))
+
     def create_widgets(self, dframe, n):
 
         pname = self.param['name']
+        toolname = self.tool_text()
+        self.applied = {}
 
         # Parameter name
         self.parameter_widget = ttk.Label(
             dframe, text=self.parameter_text(), style=self.normlabel
         )
-        self.parameter_widget.grid(column=0, row=n, sticky='ewns')
+        self.parameter_widget.grid(
+            column=0, row=n, sticky='ewns', **cellpadding
+        )
 
         # Testbench name
         self.testbench_widget = ttk.Label(
-            dframe, text=self.tool_text(), style=self.normlabel
+            dframe, text=toolname, style=self.normlabel
+        )
+        self.testbench_widget.grid(
+            column=1, row=n, sticky='ewns', **cellpadding
         )
-        self.testbench_widget.grid(column=1, row=n, sticky='ewns')
 
         # Get the status of the last simulation
         (status_value, button_style) = self.status_text()
@@ -482,7 +518,9 @@ class RowWidget:
         if self.is_plot:
 
             plot_frame = ttk.Frame(dframe)
-            plot_frame.grid(column=2, row=n, columnspan=6, sticky='ewns')
+            plot_frame.grid(
+                column=2, row=n, columnspan=6, sticky='ewns', **cellpadding
+            )
 
             self.plot_widget = ttk.Label(
                 plot_frame, text=self.plot_text(), style=self.normlabel
@@ -494,50 +532,62 @@ class RowWidget:
             self.min_limit_widget = ttk.Label(
                 dframe, text=self.min_limit_text(), style=self.normlabel
             )
-            self.min_limit_widget.grid(column=2, row=n, sticky='ewns')
+            self.min_limit_widget.grid(
+                column=2, row=n, sticky='ewns', **cellpadding
+            )
 
             (min_value, min_status_style) = self.min_value_text()
             self.min_value_widget = ttk.Label(
                 dframe, text=min_value, style=min_status_style
             )
-            self.min_value_widget.grid(column=3, row=n, sticky='ewns')
+            self.min_value_widget.grid(
+                column=3, row=n, sticky='ewns', **cellpadding
+            )
 
             # Typical widgets
             self.typ_limit_widget = ttk.Label(
                 dframe, text=self.typ_limit_text(), style=self.normlabel
             )
-            self.typ_limit_widget.grid(column=4, row=n, sticky='ewns')
+            self.typ_limit_widget.grid(
+                column=4, row=n, sticky='ewns', **cellpadding
+            )
 
             (typ_value, typ_status_style) = self.typ_value_text()
             self.typ_value_widget = ttk.Label(
                 dframe, text=typ_value, style=typ_status_style
             )
-            self.typ_value_widget.grid(column=5, row=n, sticky='ewns')
+            self.typ_value_widget.grid(
+                column=5, row=n, sticky='ewns', **cellpadding
+            )
 
             # Maximum widgets
             self.max_limit_widget = ttk.Label(
                 dframe, text=self.max_limit_text(), style=self.normlabel
             )
-            self.max_limit_widget.grid(column=6, row=n, sticky='ewns')
+            self.max_limit_widget.grid(
+                column=6, row=n, sticky='ewns', **cellpadding
+            )
 
             (max_value, max_status_style) = self.max_value_text()
             self.max_value_widget = ttk.Label(
                 dframe, text=max_value, style=max_status_style
             )
-            self.max_value_widget.grid(column=7, row=n, sticky='ewns')
+            self.max_value_widget.grid(
+                column=7, row=n, sticky='ewns', **cellpadding
+            )
 
         # Status Widget
 
         # ngspice
-        if self.tool_text() == 'ngspice':
+        if self.toolkind == 'ngspice':
             self.status_widget = ttk.Button(
                 dframe,
                 text=status_value,
                 style=button_style,
-                command=lambda pname=pname: self.fnc_failreport(pname),
+                command=functools.partial(self.fnc_failreport, pname),
             )
         # LVS
-        elif self.tool_text() == 'netgen_lvs':
+        elif self.toolkind == 'lvs':
             filename = self.parameter_manager.get_runtime_options('filename')
             dspath = os.path.split(filename)[0]
             datasheet = os.path.split(filename)[1]
@@ -558,13 +608,11 @@ class RowWidget:
                 dframe,
                 text=status_value,
                 style=button_style,
-                command=lambda lvs_file=lvs_file: self.fnc_textreport(
-                    lvs_file
-                ),
+                command=functools.partial(self.fnc_textreport, lvs_file),
             )
 
         # Area
-        elif self.tool_text() == 'magic_area':
+        elif self.toolkind == 'area':
             self.status_widget = ttk.Button(
                 dframe,
                 text=status_value,
@@ -572,7 +620,7 @@ class RowWidget:
             )
 
         # DRC
-        elif self.tool_text() == 'magic_drc':
+        elif self.toolkind == 'drc':
             self.status_widget = ttk.Button(
                 dframe,
                 text=status_value,
@@ -591,45 +639,24 @@ class RowWidget:
                 text=status_value, style=button_style, state='disabled'
             )
 
-        ToolTip(
+        self.add_tooltip(
             self.status_widget,
             text='Show detail view of simulation conditions and results',
         )
 
-        self.status_widget.grid(column=8, row=n, sticky='ewns')
+        self.status_widget.grid(column=8, row=n, sticky='ewns', **cellpadding)
 
         # Simulate widget
         self.simulate_widget = ttk.Menubutton(
             dframe, text=self.simulate_text(), style=self.normbutton
         )
 
-        # Generate pull-down menu on Simulate button.  Most items apply
-        # only to electrical parameters (at least for now)
+        # Pull-down menu on Simulate button.  Its items are only added
+        # when it is posted, see fill_simmenu()
         simmenu = tkinter.Menu(self.simulate_widget)
-        simmenu.add_command(
-            label='Run',
-            command=lambda pname=pname: self.fnc_start(pname),
-        )
-        simmenu.add_command(
-            label='Stop',
-            command=lambda pname=pname: self.fnc_stop(pname),
+        simmenu.configure(
+            postcommand=functools.partial(self.fill_simmenu, simmenu)
         )
-        if self.paramtype == 'electrical':
-            # simmenu.add_command(label='Hints',
-            # 	command = lambda param=param, simbutton=simbutton: self.add_hints(param, simbutton))
-            simmenu.add_command(
-                label='Edit',
-                command=lambda pname=pname: self.fnc_edit(pname),
-            )
-            simmenu.add_command(
-                label='Copy',
-                command=lambda pname=pname: self.fnc_copy(pname),
-            )
-            if 'editable' in self.param and self.param['editable'] == True:
-                simmenu.add_command(
-                    label='Delete',
-                    command=lambda pname=pname: self.fnc_delete(pname),
-                )
 
         # Attach the menu to the button
         self.simulate_widget.config(menu=simmenu)
@@ -637,92 +664,101 @@ class RowWidget:
         # simbutton = ttk.Button(dframe, text=simtext, style = normbutton)
         # 		command = lambda pname=pname: self.sim_param(pname))
 
-        self.simulate_widget.grid(column=9, row=n, sticky='ewns')
+        self.simulate_widget.grid(
+            column=9, row=n, sticky='ewns', **cellpadding
+        )
 
         if self.paramtype == 'electrical':
-            ToolTip(
+            self.add_tooltip(
                 self.simulate_widget,
                 text='Simulate one electrical parameter',
             )
         else:
-            ToolTip(
+            self.add_tooltip(
                 self.simulate_widget,
                 text='Check one physical parameter',
             )
 
+    def configure_widget(self, widget, **options):
+
+        # Configure the widget only if the options differ from those
+        # given last time, so that unchanged rows make no calls to Tk.
+        if self.applied.get(widget) != options:
+            widget.configure(**options)
+            self.applied[widget] = options
+
     def update_widgets(self):
 
+        # Widgets that are not created yet get the current values when
+        # they are
+        if not self.is_realized():
+            return
+
+        toolname = self.tool_text()
+
         # Parameter name
-        self.parameter_widget.configure(text=self.parameter_text())
+        self.configure_widget(
+            self.parameter_widget, text=self.parameter_text()
+        )
 
         # Testbench name
-        self.testbench_widget.configure(text=self.tool_text())
+        self.configure_widget(self.testbench_widget, text=toolname)
 
         # Get the status of the last simulation
         (status_value, button_style) = self.status_text()
 
         if self.is_plot:
             # Plot text
-            self.plot_widget.configure(text=self.plot_text())
+            self.configure_widget(self.plot_widget, text=self.plot_text())
         else:
             # Minimum widgets
-            self.min_limit_widget.configure(text=self.min_limit_text())
+            self.configure_widget(
+                self.min_limit_widget, text=self.min_limit_text()
+            )
             (min_value, min_status_style) = self.min_value_text()
-            self.min_value_widget.configure(
-                text=min_value, style=min_status_style
+            self.configure_widget(
+                self.min_value_widget, text=min_value, style=min_status_style
             )
 
             # Typical widgets
-            self.typ_limit_widget.configure(text=self.typ_limit_text())
+            self.configure_widget(
+                self.typ_limit_widget, text=self.typ_limit_text()
+            )
             (typ_value, typ_status_style) = self.typ_value_text()
-            self.typ_value_widget.configure(
-                text=typ_value, style=typ_status_style
+            self.configure_widget(
+                self.typ_value_widget, text=typ_value, style=typ_status_style
             )
 
             # Maximum widgets
-            self.max_limit_widget.configure(text=self.max_limit_text())
+            self.configure_widget(
+                self.max_limit_widget, text=self.max_limit_text()
+            )
             (max_value, max_status_style) = self.max_value_text()
-            self.max_value_widget.configure(
-                text=max_value, style=max_status_style
+            self.configure_widget(
+                self.max_value_widget, text=max_value, style=max_status_style
             )
 
         # Status Widget
 
-        # Electrical
-        if self.tool_text() == 'ngspice':
-            self.status_widget.configure(
-                text=status_value, style=button_style, state='enabled'
-            )
-
-        # Physical: LVS
-        elif self.tool_text() == 'cace_lvs':
-            self.status_widget.configure(
-                text=status_value, style=button_style, state='enabled'
-            )
-
-        # Physical: Area
-        elif self.tool_text() == 'cace_area':
-            self.status_widget.configure(
-                text=status_value, style=button_style, state='enabled'
-            )
-
-        # Physical: DRC
-        elif self.tool_text() == 'cace_drc':
-            self.status_widget.configure(
-                text=status_value, style=button_style, state='enabled'
-            )
+        # Electrical: ngspice
+        # Physical: LVS, Area, DRC
+        if self.toolkind != 'other':
+            status_state = 'enabled'
 
         # Other physical parameters, disabled
         else:
-            self.status_widget.configure(
-                text=status_value, style=button_style, state='disabled'
-            )
+            status_state = 'disabled'
 
         # Not yet checked, disabled
         if status_value == '(not checked)' or status_value == '(N/A)':
-            self.status_widget.configure(
-                text=status_value, style=button_style, state='disabled'
-            )
+            status_state = 'disabled'
+
+        self.configure_widget(
+            self.status_widget,
+            text=status_value,
+            style=button_style,
+            state=status_state,
+        )
 
         # Simulate widget
-        self.simulate_widget.configure(text=self.simulate_text())
+        self.configure_widget(self.simulate_widget, text=self.simulate_text())
@@ -14,6 +14,22 @@ import re
 import tkinter
 from tkinter import ttk
 
+# Checkbuttons of the settings window:  (setting name, widget
+# attribute, text, shown).  Hidden ones keep their default value.
+checkbuttons = (
+    ('debug', 'debug', 'Print debug output', True),
+    ('force', 'force', 'Force netlist regeneration', False),
+    ('edit', 'edit', 'Allow edit of all parameters', True),
+    ('sequential', 'seq', 'Simulate single-threaded', True),
+    ('keep', 'keep', 'Keep simulation files', True),
+    ('noplot', 'plot', 'Do not create plot files', True),
+    ('schem', 'schem', 'Force characterization as schematic only', True),
+    ('log', 'log', 'Log simulation output', True),
+)
+
+# Valid contents of the parallel parameters entry:  a positive integer
+positive_integer = re.compile(r'0*[1-9][0-9]*')
+
 
 class Settings(tkinter.Toplevel):
     """characterization tool settings management."""
@@ -38,69 +54,15 @@ class Settings(tkinter.Toplevel):
         self.sframe.sbar = ttk.Separator(self.sframe, orient='horizontal')
         self.sframe.sbar.pack(side='top', fill='x', expand='true')
 
-        self.dodebug = tkinter.IntVar(self.sframe)
-        self.dodebug.set(0)
-        self.sframe.debug = ttk.Checkbutton(
-            self.sframe, text='Print debug output', variable=self.dodebug
-        )
-        self.sframe.debug.pack(side='top', anchor='w')
-
-        self.doforce = tkinter.IntVar(self.sframe)
-        self.doforce.set(0)
-        self.sframe.force = ttk.Checkbutton(
-            self.sframe,
-            text='Force netlist regeneration',
-            variable=self.doforce,
-        )
-        # self.sframe.force.pack(side = 'top', anchor = 'w')
-
-        self.doedit = tkinter.IntVar(self.sframe)
-        self.doedit.set(0)
-        self.sframe.edit = ttk.Checkbutton(
-            self.sframe,
-            text='Allow edit of all parameters',
-            variable=self.doedit,
-        )
-        self.sframe.edit.pack(side='top', anchor='w')
-
-        self.dosequential = tkinter.IntVar(self.sframe)
-        self.dosequential.set(0)
-        self.sframe.seq = ttk.Checkbutton(
-            self.sframe,
-            text='Simulate single-threaded',
-            variable=self.dosequential,
-        )
-        self.sframe.seq.pack(side='top', anchor='w')
-
-        self.dokeep = tkinter.IntVar(self.sframe)
-        self.dokeep.set(0)
-        self.sframe.keep = ttk.Checkbutton(
-            self.sframe, text='Keep simulation files', variable=self.dokeep
-        )
-        self.sframe.keep.pack(side='top', anchor='w')
-
-        self.noplot = tkinter.IntVar(self.sframe)
-        self.noplot.set(0)
-        self.sframe.plot = ttk.Checkbutton(
-            self.sframe, text='Do not create plot files', variable=self.noplot
-        )
-        self.sframe.plot.pack(side='top', anchor='w')
-
-        self.doschem = tkinter.IntVar(self.sframe)
-        self.doschem.set(0)
-        self.sframe.schem = ttk.Checkbutton(
-            self.sframe,
-            text='Force characterization as schematic only',
-            variable=self.doschem,
-        )
-        self.sframe.schem.pack(side='top', anchor='w')
-
-        self.dolog = tkinter.IntVar(self.sframe)
-        self.dolog.set(0)
-        self.sframe.log = ttk.Checkbutton(
-            self.sframe, text='Log simulation output', variable=self.dolog
-        )
-        self.sframe.log.pack(side='top', anchor='w')
+        # Create the checkbuttons and their variables, and show them
+        self.settingvars = {}
+        for setting, name, text, shown in checkbuttons:
+            var = tkinter.IntVar(self.sframe, value=0)
+            self.settingvars[setting] = var
+            checkbutton = ttk.Checkbutton(self.sframe, text=text, variable=var)
+            setattr(self.sframe, name, checkbutton)
+            if shown:
+                checkbutton.pack(side='top', anchor='w')
 
         parallel_parameters = (
             self.parent.parameter_manager.get_runtime_options(
@@ -156,16 +118,9 @@ class Settings(tkinter.Toplevel):
         widget_name,
     ):
         # action=1 -> insert
-        if action == '1':
-            if text in '0123456789':
-                try:
-                    return int(value_if_allowed) > 0
-                except ValueError:
-                    return False
-            else:
-                return False
-        else:
+        if action != '1':
             return True
+        return positive_integer.fullmatch(value_if_allowed) is not None
 
     def grid_configure(self, padx, pady):
         pass
@@ -173,41 +128,13 @@ class Settings(tkinter.Toplevel):
     def redisplay(self):
         pass
 
-    def get_force(self):
-        # return the state of the "force netlist regeneration" checkbox
-        return False if self.doforce.get() == 0 else True
-
-    def get_edit(self):
-        # return the state of the "edit all parameters" checkbox
-        return False if self.doedit.get() == 0 else True
+    def get_setting(self, setting):
+        # return the state of the checkbox of the given setting
+        return bool(self.settingvars[setting].get())
 
     def set_debug(self, debug):
         # set the state of the "print debug output" checkbox
-        self.dodebug.set(debug)
-
-    def get_debug(self):
-        # return the state of the "print debug output" checkbox
-        return False if self.dodebug.get() == 0 else True
-
-    def get_keep(self):
-        # return the state of the "keep simulation files" checkbox
-        return False if self.dokeep.get() == 0 else True
-
-    def get_sequential(self):
-        # return the state of the "simulate single-threaded" checkbox
-        return False if self.dosequential.get() == 0 else True
-
-    def get_noplot(self):
-        # return the state of the "do not create plot files" checkbox
-        return False if self.noplot.get() == 0 else True
-
-    def get_schem(self):
-        # return the state of the "characterize as schematic" checkbox
-        return False if self.doschem.get() == 0 else True
-
-    def get_log(self):
-        # return the state of the "log simulation output" checkbox
-        return False if self.dolog.get() == 0 else True
+        self.settingvars['debug'].set(debug)
 
     def get_parallel_parameters(self):
         # return the maximum number of parallel parameters
@@ -10,7 +10,6 @@
 # Version 0.1
 # --------------------------------------------------------
 
-import re
 import tkinter
 from tkinter import ttk
 
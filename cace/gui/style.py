@@ -13,27 +13,40 @@
 # limitations under the License.
 
 import os
-import tkinter
+import json
 from tkinter import ttk
 
 # User preferences file (if it exists)
 prefsfile = '~/design/.profile/prefs.json'
 
+# Font size of the global style, once it has been set
+style_fontsize = None
+
 
 def init_style():
     """Sets the global style"""
 
+    global style_fontsize
+
+    # The style only needs to be set once
+    if style_fontsize is not None:
+        return style_fontsize
+
     fontsize = 11
 
     # Read user preferences file, get default font size from it.
     prefspath = os.path.expanduser(prefsfile)
-    if os.path.exists(prefspath):
+    try:
         with open(prefspath, 'r') as f:
             prefs = json.load(f)
-        if 'fontsize' in prefs:
-            fontsize = prefs['fontsize']
-    else:
+    except FileNotFoundError:
         prefs = {}
+    fontsize = prefs.get('fontsize', fontsize)
+
+    normalfont = ('Helvetica', fontsize)
+    boldfont = ('Helvetica', fontsize, 'bold')
+    italicfont = ('Helvetica', fontsize, 'italic')
+    bolditalicfont = ('Helvetica', fontsize, 'bold italic')
 
     s = ttk.Style()
 
@@ -41,75 +54,71 @@ def init_style():
     s.theme_use(available_themes[0])
 
     s.configure('bg.TFrame', background='gray40')
-    s.configure(
-        'italic.TLabel', font=('Helvetica', fontsize, 'italic')
-    )   # anchor='west'
+    s.configure('italic.TLabel', font=italicfont)   # anchor='west'
     s.configure(
         'title.TLabel',
-        font=('Helvetica', fontsize, 'bold'),
+        font=boldfont,
         foreground='brown',
         anchor='center',
     )
-    s.configure('normal.TLabel', font=('Helvetica', fontsize))
-    s.configure('red.TLabel', font=('Helvetica', fontsize), foreground='red')
+    s.configure('normal.TLabel', font=normalfont)
+    s.configure('red.TLabel', font=normalfont, foreground='red')
     s.configure(
         'green.TLabel',
-        font=('Helvetica', fontsize),
+        font=normalfont,
         foreground='green3',  # green4
     )
-    s.configure('blue.TLabel', font=('Helvetica', fontsize), foreground='blue')
-    s.configure(
-        'hlight.TLabel', font=('Helvetica', fontsize), background='gray93'
-    )
+    s.configure('blue.TLabel', font=normalfont, foreground='blue')
+    s.configure('hlight.TLabel', font=normalfont, background='gray93')
     s.configure(
         'rhlight.TLabel',
-        font=('Helvetica', fontsize),
+        font=normalfont,
         foreground='red',
         background='gray93',
     )
     s.configure(
         'ghlight.TLabel',
-        font=('Helvetica', fontsize),
+        font=normalfont,
         foreground='green3',
         background='gray93',
     )
     s.configure(
         'blue.TMenubutton',
-        font=('Helvetica', fontsize),
+        font=normalfont,
         foreground='blue',
         border=3,
         relief='raised',
     )
     s.configure(
         'normal.TButton',
-        font=('Helvetica', fontsize),
+        font=normalfont,
         border=3,
         relief='raised',
     )
     s.configure(
         'red.TButton',
-        font=('Helvetica', fontsize),
+        font=normalfont,
         foreground='red',
         border=3,
         relief='raised',
     )
     s.configure(
         'green.TButton',
-        font=('Helvetica', fontsize),
+        font=normalfont,
         foreground='green3',  # green4
         border=3,
         relief='raised',
     )
     s.configure(
         'hlight.TButton',
-        font=('Helvetica', fontsize),
+        font=normalfont,
         border=3,
         relief='raised',
         background='gray93',
     )
     s.configure(
         'rhlight.TButton',
-        font=('Helvetica', fontsize),
+        font=normalfont,
         foreground='red',
         border=3,
         relief='raised',
@@ -117,7 +126,7 @@ def init_style():
     )
     s.configure(
         'ghlight.TButton',
-        font=('Helvetica', fontsize),
+        font=normalfont,
         foreground='green3',
         border=3,
         relief='raised',
@@ -125,37 +134,38 @@ def init_style():
     )
     s.configure(
         'blue.TButton',
-        font=('Helvetica', fontsize),
+        font=normalfont,
         foreground='blue',
         border=3,
         relief='raised',
     )
     s.configure(
         'redtitle.TButton',
-        font=('Helvetica', fontsize, 'bold italic'),
+        font=bolditalicfont,
         foreground='red',
         border=3,
         relief='raised',
     )
     s.configure(
         'bluetitle.TButton',
-        font=('Helvetica', fontsize, 'bold'),
+        font=boldfont,
         foreground='blue',
         border=3,
         relief='raised',
     )
     s.configure(
         'brown.TLabel',
-        font=('Helvetica', fontsize, 'italic'),
+        font=italicfont,
         foreground='brown',
         anchor='center',
     )
     s.configure(
         'title.TButton',
-        font=('Helvetica', fontsize, 'bold italic'),
+        font=bolditalicfont,
         foreground='brown',
         border=0,
         relief='groove',
     )
 
+    style_fontsize = fontsize
     return fontsize
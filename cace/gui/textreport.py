@@ -12,7 +12,6 @@
 # --------------------------------------------------------
 
 import os
-import re
 import tkinter
 from tkinter import ttk
 
@@ -2,7 +2,6 @@
 #
 # Dialog class for tkinter
 
-import os
 import tkinter
 from tkinter import ttk
 
@@ -12,11 +12,26 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import importlib
+
 from .parameter_manager import ParameterManager
 
-from .parameter_netgen_lvs import ParameterNetgenLVS
-from .parameter_magic_drc import ParameterMagicDRC
-from .parameter_magic_area import ParameterMagicArea
-from .parameter_magic_antenna_check import ParameterMagicAntennaCheck
-from .parameter_ngspice import ParameterNgspice
-from .parameter_klayout_drc import ParameterKLayoutDRC
+# The parameter classes of the tools are only imported when used.  The
+# ParameterManager imports the module of a tool when a parameter is queued.
+parameter_classes = {
+    'ParameterNetgenLVS': '.parameter_netgen_lvs',
+    'ParameterMagicDRC': '.parameter_magic_drc',
+    'ParameterMagicArea': '.parameter_magic_area',
+    'ParameterMagicAntennaCheck': '.parameter_magic_antenna_check',
+    'ParameterNgspice': '.parameter_ngspice',
+    'ParameterKLayoutDRC': '.parameter_klayout_drc',
+}
+
+
+def __getattr__(name):
+    if name in parameter_classes:
+        module = importlib.import_module(parameter_classes[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
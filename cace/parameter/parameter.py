@@ -15,15 +15,13 @@
 import os
 import re
 import sys
-import copy
+import itertools
 import traceback
 import subprocess
-from statistics import median, mean
+import concurrent.futures
+from statistics import median, fmean
 from enum import Enum
 from abc import abstractmethod, ABC
-from threading import Thread
-from multiprocessing import cpu_count
-from multiprocessing.pool import ThreadPool
 from matplotlib.figure import Figure
 
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
@@ -34,6 +32,8 @@ from ..common.misc import mkdirp
 from ..common.spiceunits import spice_unit_convert
 from ..common.common import linseq, logseq
 from ..logging import (
+    LogLevels,
+    get_log_level,
     dbg,
     verbose,
     info,
@@ -54,20 +54,18 @@ class ResultType(Enum):
     CANCELED = 5
 
     def __str__(self):
-        if self.value == ResultType.UNKNOWN.value:
-            return 'Unknown ❓'
-        elif self.value == ResultType.ERROR.value:
-            return 'Error ❗'
-        elif self.value == ResultType.SUCCESS.value:
-            return 'Pass ✅'
-        elif self.value == ResultType.FAILURE.value:
-            return 'Fail ❌'
-        elif self.value == ResultType.SKIPPED.value:
-            return 'Skip 🟧'
-        elif self.value == ResultType.CANCELED.value:
-            return 'Cancel 🟧'
-        else:
-            return '???'
+        return result_type_text.get(self, '???')
+
+
+# Text shown for each result type
+result_type_text = {
+    ResultType.UNKNOWN: 'Unknown ❓',
+    ResultType.ERROR: 'Error ❗',
+    ResultType.SUCCESS: 'Pass ✅',
+    ResultType.FAILURE: 'Fail ❌',
+    ResultType.SKIPPED: 'Skip 🟧',
+    ResultType.CANCELED: 'Cancel 🟧',
+}
 
 
 class Result:
@@ -126,7 +124,7 @@ class Condition:
         return f'{self.name} {self.description} {self.display} {self.unit} {self.spec} {self.values}'
 
     def generate_values(self):
-        self.values = [val for val in self.condition_gen()]
+        self.values = list(self.condition_gen())
 
     def condition_gen(self):
         """
@@ -183,14 +181,52 @@ class Condition:
                 yield self.spec['maximum']
 
 
-class Parameter(ABC, Thread):
+class Parameter(ABC):
     """
     Base class for all parameters.
+    Parameters are run in a worker thread of an executor, see start().
     """
 
     # Vectors in name[number|range] format
     vectrex = re.compile(r'([^\[]+)\[([0-9:]+)\]')
 
+    # Variable names {name} in templates, by (escape, legacy_format)
+    condition_namerex = {
+        (True, True): re.compile(r'\\\{([^ \}\t]+)\\\}'),
+        (True, False): re.compile(r'CACE\\\{([^ \}\t]+)\\\}'),
+        (False, True): re.compile(r'\{([^ \}\t]+)\}'),
+        (False, False): re.compile(r'CACE\{([^ \}\t]+)\}'),
+    }
+
+    # Substitutions in templates, by (escape, legacy_format).
+    # These are applied to the whole template and must not match
+    # across lines.
+    # varex:		variable name {name}
+    # sweepex:		name in {cond|value} format
+    # brackrex:		expressions in [expression] format
+    substitutionrex = {
+        (True, True): (
+            re.compile(r'\\\{([^\\\}\n]+)\\\}'),
+            re.compile(r'\\\{([^\\\}\n]+)\|([^ \\\}\n]+)\\\}'),
+            re.compile(r'\[([^\]\n]+)\]'),
+        ),
+        (True, False): (
+            re.compile(r'CACE\\\{([^\\\}\n]+)\\\}'),
+            re.compile(r'CACE\\\{([^\\\}\n]+)\|([^ \\\}\n]+)\\\}'),
+            re.compile(r'CACE\[([^\]\n]+)\]'),
+        ),
+        (False, True): (
+            re.compile(r'\{([^\}\n]+)\}'),
+            re.compile(r'\{([^\}\n]+)\|([^ \}\n]+)\}'),
+            re.compile(r'\[([^\]\n]+)\]'),
+        ),
+        (False, False): (
+            re.compile(r'CACE\{([^\}\n]+)\}'),
+            re.compile(r'CACE\{([^\}\n]+)\|([^ \}\n]+)\}'),
+            re.compile(r'CACE\[([^\]\n]+)\]'),
+        ),
+    }
+
     def __init__(
         self,
         pname,
@@ -205,6 +241,7 @@ class Parameter(ABC, Thread):
         end_cb=None,
         cancel_cb=None,
         step_cb=None,
+        sim_pool=None,
         *args,
         **kwargs,
     ):
@@ -220,13 +257,21 @@ class Parameter(ABC, Thread):
         self.end_cb = end_cb
         self.cancel_cb = cancel_cb
         self.step_cb = step_cb
+        self.sim_pool = sim_pool
 
         self.started = False
+        self.future = None
 
         self.harvested = False
 
         self.subproc_handle = None
 
+        # Templates read by substitute(), see read_template()
+        self.template_cache = {}
+
+        # Templates of datasheets up to format 5.0 have no CACE prefix
+        self.legacy_format = self.datasheet['cace_format'] <= 5.0
+
         self.param_dir = os.path.abspath(
             os.path.join(self.run_dir, 'parameters', pname)
         )
@@ -247,8 +292,6 @@ class Parameter(ABC, Thread):
         self.canceled = False
         self.done = False
 
-        super().__init__(*args, **kwargs)
-
     def add_argument(self, arg: Argument):
         if arg.required:
             if not self.tooldict or not arg.name in self.tooldict:
@@ -275,6 +318,20 @@ class Parameter(ABC, Thread):
 
         return None
 
+    def split_vector(self, name):
+        """
+        Split a name in name[number|range] format into the name and
+        the list of indices.  Other names are returned with no indices.
+        """
+
+        # Most names are not vectors, skip the regex for them
+        if '[' in name:
+            pmatch = self.vectrex.match(name)
+            if pmatch:
+                return pmatch.group(1), pmatch.group(2).split(':')
+
+        return name, None
+
     def cancel(self, no_cb):
         info(f'Parameter {self.pname}: Canceled.')
         self.canceled = True
@@ -286,7 +343,7 @@ class Parameter(ABC, Thread):
             self.cancel_cb = None
 
     def cancel_point(self):
-        """If canceled, call the cancel cb and exit the thread"""
+        """If canceled, call the cancel cb and stop running the parameter"""
 
         if self.canceled:
             self.result_type = ResultType.CANCELED
@@ -294,6 +351,22 @@ class Parameter(ABC, Thread):
                 self.cancel_cb(self.param)
             sys.exit()
 
+    def start(self, executor):
+        """Run the parameter in a worker thread of the executor"""
+
+        self.future = executor.submit(self.run)
+
+    def is_alive(self):
+        """Return True while the parameter is waiting to run or running"""
+
+        return self.future is not None and not self.future.done()
+
+    def join(self):
+        """Wait until the parameter has run"""
+
+        if self.future:
+            concurrent.futures.wait([self.future])
+
     def is_runnable(self):
         return True
 
@@ -354,10 +427,13 @@ class Parameter(ABC, Thread):
             f'Subprocess {proc} {" ".join(args)} at \'[repr.filename][link=file://{os.path.abspath(cwd)}]{os.path.relpath(cwd)}[/link][/repr.filename]\'…'
         )
 
-        with subprocess.Popen(
+        stdout_path = f'{os.path.join(cwd, proc)}_stdout.out'
+
+        # stdout can be large, so it is written directly to its file
+        with open(stdout_path, 'w') as stdout_file, subprocess.Popen(
             [proc] + args,
             cwd=cwd,
-            stdout=subprocess.PIPE,
+            stdout=stdout_file,
             stderr=subprocess.PIPE,
             stdin=subprocess.PIPE if input else subprocess.DEVNULL,
             env=env,
@@ -368,21 +444,21 @@ class Parameter(ABC, Thread):
 
             if input != None:
                 dbg(f'input: {input}')
-            stdout, stderr = process.communicate(input)
+            _, stderr = process.communicate(input)
             returncode = process.returncode
 
             if returncode != 0:
                 err(f'Subprocess exited with error code {returncode}')
 
-            # Print stderr
+            # Print stderr as a single block, so that parallel
+            # parameters don't contend for the logger on each line
             if stderr and returncode != 0:
                 err('Error output generated by subprocess:')
-                for line in stderr.splitlines():
-                    err(line.rstrip('\n'))
+                err(stderr.rstrip('\n'))
             else:
                 dbg('Error output generated by subprocess:')
-                for line in stderr.splitlines():
-                    dbg(line.rstrip('\n'))
+                if stderr:
+                    dbg(stderr.rstrip('\n'))
 
             # Write stderr to file
             if stderr:
@@ -391,18 +467,13 @@ class Parameter(ABC, Thread):
                 ) as stderr_file:
                     stderr_file.write(stderr)
 
-            # Print stdout
+        # Print stdout, read back only if it is going to be logged
+        if get_log_level() <= LogLevels.DEBUG:
+            with open(stdout_path, 'r') as stdout_file:
+                stdout = stdout_file.read()
             if stdout:
                 dbg(f'Output from subprocess {proc}:')
-                for line in stdout.splitlines():
-                    dbg(line.rstrip())
-
-            # Write stdout to file
-            if stdout:
-                with open(
-                    f'{os.path.join(cwd, proc)}_stdout.out', 'w'
-                ) as stdout_file:
-                    stdout_file.write(stdout)
+                dbg(stdout.rstrip())
 
         self.subproc_handle = None
 
@@ -431,36 +502,32 @@ class Parameter(ABC, Thread):
         # For each named result in the spec
         for named_result in self.param['spec']:
 
-            if not self.get_result(named_result):
+            result_obj = self.get_result(named_result)
+            if not result_obj:
                 err(f'No result "{named_result}" available.')
                 self.result_type = ResultType.ERROR
                 continue
 
+            spec = self.param['spec'][named_result]
+
+            # Prefer the local unit, else use the global unit
+            unit = spec.get('unit') or self.param.get('unit')
+
             # For each entry in the specs
             for entry in ['minimum', 'typical', 'maximum']:
 
-                if entry in self.param['spec'][named_result]:
-                    value = self.param['spec'][named_result][entry]['value']
-                    fail = (
-                        self.param['spec'][named_result][entry]['fail']
-                        if 'fail' in self.param['spec'][named_result][entry]
-                        else defaults[entry]['fail']
-                    )
-                    calculation = (
-                        self.param['spec'][named_result][entry]['calculation']
-                        if 'calculation'
-                        in self.param['spec'][named_result][entry]
-                        else defaults[entry]['calculation']
-                    )
-                    limit = (
-                        self.param['spec'][named_result][entry]['limit']
-                        if 'limit' in self.param['spec'][named_result][entry]
-                        else defaults[entry]['limit']
+                if entry in spec:
+                    entry_spec = spec[entry]
+                    value = entry_spec['value']
+                    fail = entry_spec.get('fail', defaults[entry]['fail'])
+                    calculation = entry_spec.get(
+                        'calculation', defaults[entry]['calculation']
                     )
+                    limit = entry_spec.get('limit', defaults[entry]['limit'])
 
                     # Check if there are values for the named result
-                    if self.get_result(named_result).values:
-                        values = self.get_result(named_result).values
+                    if result_obj.values:
+                        values = result_obj.values
 
                         # Calculate a single value from a vector
                         if calculation == 'minimum':
@@ -470,7 +537,7 @@ class Parameter(ABC, Thread):
                         elif calculation == 'median':
                             result = median(values)
                         elif calculation == 'average':
-                            result = mean(values)
+                            result = fmean(values)
                         else:
                             err(f'Unknown calculation type: {calculation}')
                     else:
@@ -478,7 +545,7 @@ class Parameter(ABC, Thread):
                         self.result_type = ResultType.ERROR
                         result = None
 
-                    self.get_result(named_result).result[entry] = result
+                    result_obj.result[entry] = result
                     dbg(
                         f'Got {entry} result for {self.pname} {named_result}: {result}'
                     )
@@ -488,21 +555,6 @@ class Parameter(ABC, Thread):
                     # Check result against a limit
                     if value != 'any' and fail == True:
 
-                        # Prefer the local unit
-                        unit = (
-                            self.param['spec'][named_result]['unit']
-                            if 'unit' in self.param['spec'][named_result]
-                            else None
-                        )
-
-                        # Else use the global unit
-                        if not unit:
-                            unit = (
-                                self.param['unit']
-                                if 'unit' in self.param
-                                else None
-                            )
-
                         # Scale value with unit
                         if unit:
                             dbg(f'scaling {value} with {unit}')
@@ -529,7 +581,7 @@ class Parameter(ABC, Thread):
                             else:
                                 err(f'Unknown limit type: {limit}')
 
-                    self.get_result(named_result).status[entry] = status
+                    result_obj.status[entry] = status
 
                     dbg(
                         f'Got {entry} status for {self.pname} {named_result}: {status}'
@@ -537,8 +589,8 @@ class Parameter(ABC, Thread):
 
             # Final checks for failure
             for entry in ['minimum', 'typical', 'maximum']:
-                if self.get_result(named_result).result[entry]:
-                    if self.get_result(named_result).status[entry] == 'fail':
+                if result_obj.result[entry]:
+                    if result_obj.status[entry] == 'fail':
                         # If any spec fails, fail the whole parameter
                         self.result_type = ResultType.FAILURE
 
@@ -551,9 +603,7 @@ class Parameter(ABC, Thread):
             new_cond = Condition()
 
             # Remove any bit slices
-            pmatch = self.vectrex.match(cond)
-            if pmatch:
-                cond = pmatch.group(1)
+            cond, _ = self.split_vector(cond)
 
             new_cond.name = cond
 
@@ -581,9 +631,7 @@ class Parameter(ABC, Thread):
             new_cond = Condition()
 
             # Remove any bit slices
-            pmatch = self.vectrex.match(cond)
-            if pmatch:
-                cond = pmatch.group(1)
+            cond, _ = self.split_vector(cond)
 
             new_cond.name = cond
 
@@ -603,51 +651,29 @@ class Parameter(ABC, Thread):
         return conditions_param
 
     def generate_condition_sets(self, conditions):
-        num_sets = 1
 
-        # Get the total number of condition sets
-        for cond in conditions:
-            num_sets *= max(len(conditions[cond].values), 1)
+        # Get the values of each condition as used in the condition sets
+        condition_values = []
+        for cond in conditions.values():
+            if not cond.values:
+                condition_values.append([None])
+            elif cond.unit:
+                unit = str(cond.unit)
+                condition_values.append(
+                    [
+                        spice_unit_convert((unit, str(value)))
+                        for value in cond.values
+                    ]
+                )
+            else:
+                condition_values.append([str(value) for value in cond.values])
 
         # Get the condition sets for each simulation
-        # (the unique combinations of all conditions)
+        # (the unique combinations of all conditions).
+        # The first condition changes fastest.
         condition_sets = []
-        cond_index = [0] * len(conditions)
-
-        for _ in range(num_sets):
-            condition_set = {}
-            overflow = False
-
-            for index, cond in enumerate(conditions):
-                if conditions[cond].values:
-                    if conditions[cond].unit:
-                        value = conditions[cond].values[cond_index[index]]
-                        unit = conditions[cond].unit
-                        condition_set[cond] = spice_unit_convert(
-                            (str(unit), str(value))
-                        )
-                    else:
-                        condition_set[cond] = str(
-                            conditions[cond].values[cond_index[index]]
-                        )
-                else:
-                    condition_set[cond] = None
-
-                # The first condition always increments its index
-                if index == 0:
-                    cond_index[index] += 1
-                # The conditions that come after only increment
-                # if the previous condition just overflowed
-                elif overflow:
-                    cond_index[index] += 1
-                    overflow = False
-
-                # Check whether the condition reached its maximum
-                if cond_index[index] == max(len(conditions[cond].values), 1):
-                    cond_index[index] = 0
-                    overflow = True
-
-            condition_sets.append(condition_set)
+        for values in itertools.product(*reversed(condition_values)):
+            condition_sets.append(dict(zip(conditions, reversed(values))))
 
         return condition_sets
 
@@ -667,18 +693,8 @@ class Parameter(ABC, Thread):
 
         simlines = simtext.splitlines()
 
-        # Regular expressions
-        # varex:		variable name {name}
-        if escape:
-            if self.datasheet['cace_format'] <= 5.0:
-                varex = re.compile(r'\\\{([^ \}\t]+)\\\}')
-            else:
-                varex = re.compile(r'CACE\\\{([^ \}\t]+)\\\}')
-        else:
-            if self.datasheet['cace_format'] <= 5.0:
-                varex = re.compile(r'\{([^ \}\t]+)\}')
-            else:
-                varex = re.compile(r'CACE\{([^ \}\t]+)\}')
+        # Regular expression for the variable name {name}
+        varex = self.condition_namerex[(escape, self.legacy_format)]
 
         conditions = {}
 
@@ -696,9 +712,7 @@ class Parameter(ABC, Thread):
                     (pattern, cond_type) = pattern.split('|')
 
                 # Remove any bit slices
-                pmatch = self.vectrex.match(pattern)
-                if pmatch:
-                    pattern = pmatch.group(1)
+                pattern, _ = self.split_vector(pattern)
 
                 # Create new conditions
                 new_cond = Condition()
@@ -709,6 +723,41 @@ class Parameter(ABC, Thread):
 
         return conditions
 
+    def read_template(self, template_path, escape=False):
+        """
+        Read a template with any continuation lines concatenated,
+        and each line terminated by a newline.  Returns the text and
+        whether the sweep and variable patterns occur in it.
+        The result is cached until the template file is modified.
+        """
+
+        mtime = os.path.getmtime(template_path)
+        key = (template_path, escape)
+
+        if key in self.template_cache:
+            cached_mtime, template_text, used = self.template_cache[key]
+            if cached_mtime == mtime:
+                return template_text, used
+
+        # Read template
+        with open(template_path, 'r') as infile:
+            template_text = infile.read()
+
+        # Concatenate any continuation lines
+        template_text = ''.join(
+            f'{line}\n'
+            for line in template_text.replace('\n+', ' ').splitlines()
+        )
+
+        # Patterns that occur in the template
+        varex, sweepex, _ = self.substitutionrex[(escape, self.legacy_format)]
+        used = tuple(
+            bool(pattern.search(template_text)) for pattern in (sweepex, varex)
+        )
+
+        self.template_cache[key] = (mtime, template_text, used)
+        return template_text, used
+
     def substitute(
         self,
         template_path,
@@ -718,41 +767,18 @@ class Parameter(ABC, Thread):
         reserved,
         escape=False,
     ):
-        # Regular expressions
-        # varex:		variable name {name}
-        # sweepex:		name in {cond|value} format
-        # brackrex:		expressions in [expression] format
-
-        if escape:
-            if self.datasheet['cace_format'] <= 5.0:
-                varex = re.compile(r'\\\{([^\\\}]+)\\\}')
-                sweepex = re.compile(r'\\\{([^\\\}]+)\|([^ \\\}]+)\\\}')
-                brackrex = re.compile(r'\[([^\]]+)\]')
-            else:
-                varex = re.compile(r'CACE\\\{([^\\\}]+)\\\}')
-                sweepex = re.compile(r'CACE\\\{([^\\\}]+)\|([^ \\\}]+)\\\}')
-                brackrex = re.compile(r'CACE\[([^\]]+)\]')
-        else:
-            if self.datasheet['cace_format'] <= 5.0:
-                varex = re.compile(r'\{([^\}]+)\}')
-                sweepex = re.compile(r'\{([^\}]+)\|([^ \}]+)\}')
-                brackrex = re.compile(r'\[([^\]]+)\]')
-            else:
-                varex = re.compile(r'CACE\{([^\}]+)\}')
-                sweepex = re.compile(r'CACE\{([^\}]+)\|([^ \}]+)\}')
-                brackrex = re.compile(r'CACE\[([^\]]+)\]')
+        # Regular expressions, see substitutionrex
+        varex, sweepex, brackrex = self.substitutionrex[
+            (escape, self.legacy_format)
+        ]
 
         if not os.path.isfile(template_path):
             err(f'Could not find template file {template_path}.')
             self.result_type = ResultType.ERROR
             return
 
-        # Read template into a list
-        with open(template_path, 'r') as infile:
-            template_text = infile.read()
-
-        # Concatenate any continuation lines
-        template_lines = template_text.replace('\n+', ' ').splitlines()
+        template_text, used = self.read_template(template_path, escape)
+        sweepex_used, varex_used = used
 
         def varex_sub(matchobj):
             cond_name = matchobj.group(1)
@@ -763,11 +789,7 @@ class Parameter(ABC, Thread):
                 (cond_name, default) = cond_name.split('=')
 
             # Check for bit slices
-            indices = None
-            pmatch = self.vectrex.match(cond_name)
-            if pmatch:
-                cond_name = pmatch.group(1)
-                indices = pmatch.group(2).split(':')
+            cond_name, indices = self.split_vector(cond_name)
 
             # Check whether the condition is in the set
             if cond_name in conditions_set:
@@ -782,32 +804,24 @@ class Parameter(ABC, Thread):
                 # Extract certain bits
                 else:
                     try:
+                        value = int(conditions_set[cond_name])
 
                         # Single bit
                         if len(indices) == 1:
-                            # Convert number into binary first
-                            length = int(indices[0]) + 1
-                            binary = format(
-                                int(conditions_set[cond_name]), f'0{length}b'
-                            )
-                            end = len(binary)
-                            replace = binary[end - 1 - int(indices[0])]
-                        # Bit slice
-                        elif len(indices) == 1:
-                            # Convert number into binary first
-                            length = max(
-                                int(indices[0]) + 1, int(indices[1]) + 1
-                            )
-                            binary = format(
-                                int(conditions_set[cond_name]), f'0{length}b'
-                            )
-                            end = len(binary)
-                            replace = binary[
-                                end
-                                - 1
-                                - int(indices[0]) : end
-                                - int(indices[1])
-                            ]
+                            bit = int(indices[0])
+                            replace = str((value >> bit) & 1)
+                        # Bit slice [msb:lsb], as binary string
+                        elif len(indices) == 2:
+                            msb = int(indices[0])
+                            lsb = int(indices[1])
+                            if msb < lsb:
+                                err(
+                                    f'Bit slice is not in [msb:lsb] order: {matchobj.group(1)}'
+                                )
+                                return ''
+                            width = msb - lsb + 1
+                            bits = (value >> lsb) & ((1 << width) - 1)
+                            replace = format(bits, f'0{width}b')
                         else:
                             err(
                                 f'This bit slice is not supported: {matchobj.group(1)}'
@@ -864,25 +878,84 @@ class Parameter(ABC, Thread):
                 err(f'Invalid expression: {expression}.')
             return matchobj.group(0)
 
-        # Substitute values
-        substituted_lines = []
-        for template_line in template_lines:
-
-            # Substitute variable name at {name|maximum}
-            template_line = sweepex.sub(sweepex_sub, template_line)
+        # Substitute values in the whole template at once,
+        # the patterns do not match across lines.  The sweep and
+        # variable passes are skipped if their pattern does not occur
+        # in the template.  Expressions are always evaluated, as they
+        # can come from substituted values.
 
-            # Substitute variable name {name}
-            template_line = varex.sub(varex_sub, template_line)
+        # Substitute variable name at {name|maximum}
+        if sweepex_used:
+            template_text = sweepex.sub(sweepex_sub, template_text)
 
-            # Evaluate expressions [2 + 2]
-            template_line = brackrex.sub(brackrex_sub, template_line)
+        # Substitute variable name {name}
+        if varex_used:
+            template_text = varex.sub(varex_sub, template_text)
 
-            substituted_lines.append(template_line)
+        # Evaluate expressions [2 + 2]
+        template_text = brackrex.sub(brackrex_sub, template_text)
 
         # Write the output file
         with open(substituted_path, 'w') as outfile:
-            for line in substituted_lines:
-                outfile.write(f'{line}\n')
+            outfile.write(template_text)
+
+    def get_spec_limits(self, variable):
+        """
+        Get the minimum, typical and maximum values in the spec of
+        a variable.  Values that are not given or 'any' are None.
+        """
+
+        spec = self.param['spec'].get(variable, {})
+
+        spec_limits = []
+        for entry in ['minimum', 'typical', 'maximum']:
+            value = spec.get(entry, {}).get('value', 'any')
+            spec_limits.append(None if value == 'any' else float(value))
+
+        return spec_limits
+
+    def merge_condition_sets(
+        self, condition_sets, results_for_plot, removed_conditions
+    ):
+        """
+        Remove the given conditions from the condition sets, and merge
+        the results of the condition sets that become equal.  Returns
+        the new condition sets and results, in order of first occurrence.
+        """
+
+        new_condition_sets = []
+        new_results_for_plot = []
+
+        # Index of each condition set in the new condition sets
+        condition_set_indices = {}
+
+        for condition_set, results in zip(condition_sets, results_for_plot):
+
+            # Copy the condition set without the removed conditions
+            condition_set = {
+                cond: value
+                for cond, value in condition_set.items()
+                if cond not in removed_conditions
+            }
+
+            cur_key = frozenset(condition_set.items())
+
+            # Is the condition set not yet in the new condition sets?
+            if not cur_key in condition_set_indices:
+                condition_set_indices[cur_key] = len(new_condition_sets)
+                new_condition_sets.append(condition_set)
+                new_results_for_plot.append(
+                    {key: list(values) for key, values in results.items()}
+                )
+
+            # If it is already, we need to extend the results
+            else:
+                index = condition_set_indices[cur_key]
+                # Append to results
+                for key in new_results_for_plot[index].keys():
+                    new_results_for_plot[index][key].extend(results[key])
+
+        return new_condition_sets, new_results_for_plot
 
     def makeplot(
         self,
@@ -898,30 +971,27 @@ class Parameter(ABC, Thread):
             f'Parameter {self.param["name"]}: Plotting {plot_name} to \'[repr.filename][link=file://{os.path.abspath(self.param_dir)}]{os.path.relpath(self.param_dir)}[/link][/repr.filename]\'…'
         )
 
-        if (
-            not 'yaxis' in self.param['plot'][plot_name]
-            and not 'xaxis' in self.param['plot'][plot_name]
-        ):
+        plot_spec = self.param['plot'][plot_name]
+
+        if not 'yaxis' in plot_spec and not 'xaxis' in plot_spec:
             err(f'Neither yaxis nor xaxis specified in plot {plot_name}.')
             self.result_type = ResultType.ERROR
             return None
 
         xvariable = None
-        if 'xaxis' in self.param['plot'][plot_name]:
+        if 'xaxis' in plot_spec:
 
-            xvariable = self.param['plot'][plot_name]['xaxis']
+            xvariable = plot_spec['xaxis']
 
             # Remove any bit slices
-            pmatch = self.vectrex.match(xvariable)
-            if pmatch:
-                xvariable = pmatch.group(1)
+            xvariable, _ = self.split_vector(xvariable)
 
         xdisplay = xvariable
         xunit = ''
 
         yvariables = []
-        if 'yaxis' in self.param['plot'][plot_name]:
-            yvariables = self.param['plot'][plot_name]['yaxis']
+        if 'yaxis' in plot_spec:
+            yvariables = plot_spec['yaxis']
 
             # Make a list if there's only a single entry
             if not isinstance(yvariables, list):
@@ -929,18 +999,14 @@ class Parameter(ABC, Thread):
 
             for i, yvariable in enumerate(yvariables):
                 # Remove any bit slices
-                pmatch = self.vectrex.match(yvariable)
-                if pmatch:
-                    yvariables[i] = pmatch.group(1)
+                yvariables[i], _ = self.split_vector(yvariable)
 
         ydisplays = {key: key for key in yvariables}
         yunits = {key: '' for key in yvariables}
 
         # Get global display and unit
-        if 'display' in self.param:
-            xdisplay = self.param['display']
-        if 'unit' in self.param:
-            xunit = self.param['unit']
+        xdisplay = self.param.get('display', xdisplay)
+        xunit = self.param.get('unit', xunit)
 
         # If xvariable is a condition, get display and unit
         if xvariable in conditions:
@@ -960,17 +1026,13 @@ class Parameter(ABC, Thread):
                     yunits[yvariable] = conditions[yvariable].unit
 
         # Get the plot type
-        plot_type = 'xyplot'
-        if 'type' in self.param['plot'][plot_name]:
-            plot_type = self.param['plot'][plot_name]['type']
+        plot_type = plot_spec.get('type', 'xyplot')
 
         # Show limits in plots
         # true: always
         # false: never
         # auto: only if in range
-        limits = 'auto'
-        if 'limits' in self.param['plot'][plot_name]:
-            limits = self.param['plot'][plot_name]['limits']
+        limits = plot_spec.get('limits', 'auto')
 
         # Limit values
         minimum = None
@@ -980,108 +1042,29 @@ class Parameter(ABC, Thread):
         # Get the limits
         if limits != False:
 
-            # For the histogram get limits from the x variable
+            # For the histogram get limits from the x variable,
+            # else get limits from the first y variable
             if plot_type == 'histogram':
-                if xvariable in self.param['spec']:
-                    if 'minimum' in self.param['spec'][xvariable]:
-                        if 'value' in self.param['spec'][xvariable]['minimum']:
-                            value = self.param['spec'][xvariable]['minimum'][
-                                'value'
-                            ]
-                            if value != 'any':
-                                minimum = float(value)
-
-                    if 'typical' in self.param['spec'][xvariable]:
-                        if 'value' in self.param['spec'][xvariable]['typical']:
-                            value = self.param['spec'][xvariable]['typical'][
-                                'value'
-                            ]
-                            if value != 'any':
-                                typical = float(value)
-
-                    if 'maximum' in self.param['spec'][xvariable]:
-                        if 'value' in self.param['spec'][xvariable]['maximum']:
-                            value = self.param['spec'][xvariable]['maximum'][
-                                'value'
-                            ]
-                            if value != 'any':
-                                maximum = float(value)
-
-            # Else get limits from the first y variable
+                limit_variable = xvariable
             else:
-                if yvariables[0] in self.param['spec']:
-                    if 'minimum' in self.param['spec'][yvariables[0]]:
-                        if (
-                            'value'
-                            in self.param['spec'][yvariables[0]]['minimum']
-                        ):
-                            value = self.param['spec'][yvariables[0]][
-                                'minimum'
-                            ]['value']
-                            if value != 'any':
-                                minimum = float(value)
-
-                    if 'typical' in self.param['spec'][yvariables[0]]:
-                        if (
-                            'value'
-                            in self.param['spec'][yvariables[0]]['typical']
-                        ):
-                            value = self.param['spec'][yvariables[0]][
-                                'typical'
-                            ]['value']
-                            if value != 'any':
-                                typical = float(value)
-
-                    if 'maximum' in self.param['spec'][yvariables[0]]:
-                        if (
-                            'value'
-                            in self.param['spec'][yvariables[0]]['maximum']
-                        ):
-                            value = self.param['spec'][yvariables[0]][
-                                'maximum'
-                            ]['value']
-                            if value != 'any':
-                                maximum = float(value)
-
-        # Overwrite with display and unit under "spec"
-        if 'spec' in self.param:
-            if xvariable in self.param['spec']:
-                if 'display' in self.param['spec'][xvariable]:
-                    xdisplay = self.param['spec'][xvariable]['display']
-                if 'unit' in self.param['spec'][xvariable]:
-                    xunit = self.param['spec'][xvariable]['unit']
-
-            for yvariable in yvariables:
-                if yvariable in self.param['spec']:
-                    if 'display' in self.param['spec'][yvariable]:
-                        ydisplays[yvariable] = self.param['spec'][yvariable][
-                            'display'
-                        ]
-
-                    if 'unit' in self.param['spec'][yvariable]:
-                        yunits[yvariable] = self.param['spec'][yvariable][
-                            'unit'
-                        ]
-
-        # Overwrite with display and unit under "variables"
-        if 'variables' in self.param:
-            if xvariable in self.param['variables']:
-                if 'display' in self.param['variables'][xvariable]:
-                    xdisplay = self.param['variables'][xvariable]['display']
-                if 'unit' in self.param['variables'][xvariable]:
-                    xunit = self.param['variables'][xvariable]['unit']
-
-            for yvariable in yvariables:
-                if yvariable in self.param['variables']:
-                    if 'display' in self.param['variables'][yvariable]:
-                        ydisplays[yvariable] = self.param['variables'][
-                            yvariable
-                        ]['display']
-
-                    if 'unit' in self.param['variables'][yvariable]:
-                        yunits[yvariable] = self.param['variables'][yvariable][
-                            'unit'
-                        ]
+                limit_variable = yvariables[0]
+
+            minimum, typical, maximum = self.get_spec_limits(limit_variable)
+
+        # Overwrite with display and unit under "spec",
+        # then under "variables"
+        for section in ['spec', 'variables']:
+            if section in self.param:
+                xspec = self.param[section].get(xvariable, {})
+                xdisplay = xspec.get('display', xdisplay)
+                xunit = xspec.get('unit', xunit)
+
+                for yvariable in yvariables:
+                    yspec = self.param[section].get(yvariable, {})
+                    ydisplays[yvariable] = yspec.get(
+                        'display', ydisplays[yvariable]
+                    )
+                    yunits[yvariable] = yspec.get('unit', yunits[yvariable])
 
         # Assemble the string displayed at the x-axis
         xdisplay = f'{xdisplay} ({xunit})' if xunit != '' else xdisplay
@@ -1102,13 +1085,12 @@ class Parameter(ABC, Thread):
             canvas = FigureCanvasTkAgg(fig, parent)
 
         # Set the title, if given
-        if 'title' in self.param['plot'][plot_name]:
-            fig.suptitle(self.param['plot'][plot_name]['title'])
+        title = plot_spec.get('title')
+        if title is not None:
+            fig.suptitle(title)
 
         # File format
-        suffix = '.png'
-        if 'suffix' in self.param['plot'][plot_name]:
-            suffix = self.param['plot'][plot_name]['suffix']
+        suffix = plot_spec.get('suffix', '.png')
 
         # Filename for the plot
         filename = f'{plot_name}{suffix}'
@@ -1121,9 +1103,8 @@ class Parameter(ABC, Thread):
         ax.set_ylabel(ydisplay)
 
         # Enable the grid
-        if 'grid' in self.param['plot'][plot_name]:
-            if self.param['plot'][plot_name]['grid']:
-                ax.grid(True)
+        if plot_spec.get('grid'):
+            ax.grid(True)
 
         # Set opacity for histogram
         opacity = 1.0
@@ -1139,10 +1120,6 @@ class Parameter(ABC, Thread):
 
         if xvariable in conditions:
 
-            new_condition_sets = []
-            new_results_for_plot = []
-            hashes = []
-
             # We only want ticks at certain locations
             try:
                 ax.set_xticks(
@@ -1155,42 +1132,14 @@ class Parameter(ABC, Thread):
                     labels=conditions[xvariable].values,
                 )
 
-            # Get the result
-            for condition_set, results in zip(
-                condition_sets, results_for_plot
-            ):
-
-                # Create a deep copy of the condition set
-                condition_set = copy.deepcopy(condition_set)
-
-                # Remove the condition at the xaxis from the condition_set
-                condition_set.pop(xvariable)
-
-                # We also need to remove unique elements, or else no hash will match
-                condition_set.pop('N')
-                condition_set.pop('simpath')
-
-                cur_hash = hash(frozenset(condition_set.items()))
-
-                # Let' see if the condition set is not yet in the new condition sets
-                if not cur_hash in hashes:
-                    new_condition_sets.append(condition_set)
-                    new_results_for_plot.append(copy.deepcopy(results))
-                    hashes.append(cur_hash)
-
-                # If it is already, we need to extend the results
-                else:
-                    for index, this_hash in enumerate(hashes):
-                        # Found the condition set
-                        if cur_hash == this_hash:
-                            # Append to results
-                            for key in new_results_for_plot[index].keys():
-                                new_results_for_plot[index][key].extend(
-                                    list(results[key])
-                                )
-
-            condition_sets = new_condition_sets
-            results_for_plot = new_results_for_plot
+            # Remove the condition at the xaxis from the condition sets.
+            # We also need to remove unique elements, or else no
+            # condition sets will match
+            condition_sets, results_for_plot = self.merge_condition_sets(
+                condition_sets,
+                results_for_plot,
+                {xvariable, 'N', 'simpath'},
+            )
 
         # Generate the x and y values
         for condition_set, results in zip(condition_sets, results_for_plot):
@@ -1328,10 +1277,7 @@ class Parameter(ABC, Thread):
 
         # Enable the legend
         legend = None
-        if len(condition_sets) > 1 or (
-            'legend' in self.param['plot'][plot_name]
-            and self.param['plot'][plot_name]['legend']
-        ):
+        if len(condition_sets) > 1 or plot_spec.get('legend'):
             legend = ax.legend(
                 loc=2, bbox_to_anchor=(1.04, 1), borderaxespad=0.0
             )
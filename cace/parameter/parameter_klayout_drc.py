@@ -13,8 +13,6 @@
 # limitations under the License.
 
 import os
-import re
-import sys
 
 from ..common.common import run_subprocess, get_pdk_root, get_layout_path
 from .parameter import Parameter, ResultType, Argument, Result
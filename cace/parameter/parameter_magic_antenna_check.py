@@ -14,11 +14,6 @@
 
 import os
 import re
-import sys
-import math
-import json
-import threading
-import subprocess
 
 from ..common.common import run_subprocess, get_magic_rcfile, get_layout_path
 from ..common.ring_buffer import RingBuffer
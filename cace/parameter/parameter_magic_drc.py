@@ -14,7 +14,6 @@
 
 import os
 import re
-import sys
 
 from ..common.common import run_subprocess, get_magic_rcfile, get_layout_path
 from .parameter import Parameter, ResultType, Argument, Result
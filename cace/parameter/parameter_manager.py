@@ -13,15 +13,16 @@
 # limitations under the License.
 
 import os
-import re
-import sys
 import glob
 import time
 import yaml
 import shutil
-import signal
+import atexit
 import datetime
+import importlib
 import threading
+import concurrent.futures
+from multiprocessing.pool import ThreadPool
 
 from ..common.misc import mkdirp
 from ..common.cace_read import cace_read, cace_read_yaml
@@ -53,6 +54,24 @@ def register_parameter(name):
     return inner
 
 
+def load_parameter_module(toolname):
+    """
+    Import the module of a tool (parameter_<toolname>), if there is
+    one, so that its parameter class is registered
+    """
+
+    if not toolname.isidentifier():
+        return
+
+    modname = f'{__package__}.parameter_{toolname}'
+    try:
+        importlib.import_module(modname)
+    except ModuleNotFoundError as e:
+        # Only ignore a missing tool module, not a missing dependency
+        if e.name != modname:
+            raise
+
+
 class ParameterManager:
     """
     The ParameterManager manages the parameter queue
@@ -75,6 +94,11 @@ class ParameterManager:
         self.running_threads = []
         self.running_lock = threading.Lock()
 
+        # Worker threads that run the parameters
+        self.param_executor = concurrent.futures.ThreadPoolExecutor(
+            thread_name_prefix='parameter'
+        )
+
         self.results = {}
         self.result_types = {}
 
@@ -108,8 +132,14 @@ class ParameterManager:
         if not jobs:
             jobs = 4
 
+        self.jobs = jobs
         self.jobs_sem = threading.Semaphore(value=jobs)
 
+        # Thread pool for simulation jobs, shared by all parameters,
+        # see get_sim_pool()
+        self.sim_pool = None
+        self.sim_pool_lock = threading.Lock()
+
         dbg(f'Parameter manager: total number of jobs is {jobs}')
 
     ### datasheet functions ###
@@ -501,6 +531,9 @@ class ParameterManager:
             else:
                 toolname = list(tool.keys())[0]
 
+            if toolname not in registered_parameters:
+                load_parameter_module(toolname)
+
             if toolname in registered_parameters.keys():
                 cls = registered_parameters[toolname]
 
@@ -520,6 +553,8 @@ class ParameterManager:
                     end_cb,
                     cancel_cb,
                     step_cb,
+                    # Thread pool for simulation jobs
+                    sim_pool=self.get_sim_pool,
                 )
 
                 dbg(f'Inserting parameter {pname} into queue.')
@@ -539,6 +574,31 @@ class ParameterManager:
         for pname in self.datasheet['parameters']:
             warn(pname)
 
+    def get_sim_pool(self):
+        """
+        Get the thread pool for simulation jobs, shared by all parameters.
+        It is created on first use and kept until close_sim_pool().
+        """
+
+        with self.sim_pool_lock:
+            if not self.sim_pool:
+                self.sim_pool = ThreadPool(processes=self.jobs)
+                # In case the parameters are never joined
+                atexit.register(self.close_sim_pool)
+
+        return self.sim_pool
+
+    def close_sim_pool(self):
+        """Terminate the thread pool for simulation jobs, if there is one"""
+
+        # Jobs of canceled parameters may still be queued, so the pool
+        # is terminated rather than waited on
+        with self.sim_pool_lock:
+            if self.sim_pool:
+                self.sim_pool.terminate()
+                self.sim_pool = None
+                atexit.unregister(self.close_sim_pool)
+
     def prune_running_threads(self):
         """Remove threads that are either marked as done or have been canceled"""
 
@@ -692,7 +752,7 @@ class ParameterManager:
 
                 if param_thread and not param_thread.canceled:
                     dbg(f'Running parameter {param_thread.pname}')
-                    param_thread.start()
+                    param_thread.start(self.param_executor)
 
             # Else wait until another parameter has completed
             else:
@@ -713,6 +773,9 @@ class ParameterManager:
         # Remove completed threads
         self.prune_running_threads()
 
+        # No more simulation jobs
+        self.close_sim_pool()
+
     def run_parameters(self):
         """Run parameters sequentially, note that simulations can still be parallelized"""
 
@@ -737,7 +800,7 @@ class ParameterManager:
                 # Cancel the thread and start it
                 # so that it directly calls its callback
                 param_thread.cancel(no_cb)
-                param_thread.start()
+                param_thread.start(self.param_executor)
 
     def cancel_running_parameters(self, no_cb=False):
         """Cancel all running parameters"""
@@ -774,7 +837,7 @@ class ParameterManager:
                 # Cancel the thread and start it
                 # so that it directly calls its callback
                 param_thread.cancel(no_cb)
-                param_thread.start()
+                param_thread.start(self.param_executor)
 
     def cancel_running_parameter(self, pname, no_cb=False):
         """Cancel a single running parameter"""
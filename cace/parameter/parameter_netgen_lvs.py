@@ -14,8 +14,6 @@
 
 import os
 import re
-import sys
-import math
 import json
 
 from ..common.common import (
@@ -13,16 +13,16 @@
 # limitations under the License.
 
 import os
-import re
 import csv
 import sys
 import yaml
 import time
 import shutil
+import operator
 import threading
+import multiprocessing
 import traceback
 import subprocess
-from multiprocessing.pool import ThreadPool
 from importlib.machinery import SourceFileLoader
 
 from ..common.misc import mkdirp
@@ -36,6 +36,8 @@ from ..common.common import (
 from .parameter import Parameter, ResultType, Argument, Condition, Result
 from .parameter_manager import register_parameter
 from ..logging import (
+    LogLevels,
+    get_log_level,
     dbg,
     verbose,
     info,
@@ -156,7 +158,9 @@ class ParameterNgspice(Parameter):
 
     def implementation(self):
 
-        info(f'Parameter {self.param["name"]}: Generating simulation files…')
+        pname = self.param['name']
+
+        info(f'Parameter {pname}: Generating simulation files…')
 
         variables = self.get_argument('variables')
 
@@ -249,9 +253,7 @@ class ParameterNgspice(Parameter):
                 collate_variable = self.get_argument('collate')
 
                 # Remove any bit slices
-                pmatch = self.vectrex.match(collate_variable)
-                if pmatch:
-                    collate_variable = pmatch.group(1)
+                collate_variable, _ = self.split_vector(collate_variable)
 
                 info(f'Collating results using condition "{collate_variable}"')
 
@@ -266,73 +268,115 @@ class ParameterNgspice(Parameter):
             # Generate the condition sets for each simulation
             condition_sets = self.generate_condition_sets(conditions)
 
-            # For each condition set, substitute the
-            # testbench template with it
-            max_digits = len(str(len(condition_sets)))
-            for index, condition_set in enumerate(condition_sets):
+            # Values of the collate condition (if set), looped over for
+            # each condition set
+            collate_values = [1]
+            if self.get_argument('collate'):
+                collate_values = collate_condition.values
 
-                # Inner loop for collate variable (if set)
-                collate_values = [1]
+            # Directory of each run, per condition set.  Without collate
+            # there is a single run directly in the condition set's
+            # directory.
+            max_digits = len(str(len(condition_sets)))
+            run_paths = []
+            for index in range(len(condition_sets)):
+                outpath = os.path.join(
+                    self.param_dir, f'run_{index:0{max_digits}d}'
+                )
                 if self.get_argument('collate'):
-                    collate_values = collate_condition.values
-                    max_digits_collate = len(str(len(collate_values)))
+                    run_paths.append(
+                        [
+                            os.path.join(
+                                outpath, f'run_{collate_index:0{max_digits}d}'
+                            )
+                            for collate_index in range(len(collate_values))
+                        ]
+                    )
+                else:
+                    run_paths.append([outpath])
 
-                for collate_index, collate_value in enumerate(collate_values):
+            # The DUT netlist, the PDK and the xschem symbol are the same
+            # for all simulations, so look them up once.
 
-                    self.cancel_point()
+            dname = self.datasheet['name']
 
-                    # Create directory for this run
-                    outpath = os.path.join(
-                        self.param_dir, f'run_{index:0{max_digits}d}'
-                    )
+            # Get DUT netlist path
+            source = self.runtime_options['netlist_source']
 
-                    if self.get_argument('collate'):
-                        outpath = os.path.join(
-                            outpath, f'run_{collate_index:0{max_digits}d}'
-                        )
+            if source == 'schematic':
+                netlistpath = os.path.join(self.paths['netlist'], 'schematic')
+            elif source == 'layout':
+                netlistpath = os.path.join(self.paths['netlist'], 'layout')
+            elif source == 'pex':
+                netlistpath = os.path.join(self.paths['netlist'], 'pex')
+            elif source == 'rcx':
+                netlistpath = os.path.join(self.paths['netlist'], 'rcx')
 
-                    dbg(f"Creating directory: '{os.path.relpath(outpath)}'.")
-                    mkdirp(outpath)
+            dutpath = os.path.join(
+                self.paths['root'],
+                netlistpath,
+                dname + '.spice',
+            )
 
-                    # Get DUT netlist path
-                    source = self.runtime_options['netlist_source']
+            if not os.path.isfile(dutpath):
+                err(f'Could not find dut netlist {dutpath}.')
 
-                    if source == 'schematic':
-                        netlistpath = os.path.join(
-                            self.paths['netlist'], 'schematic'
-                        )
-                    elif source == 'layout':
-                        netlistpath = os.path.join(
-                            self.paths['netlist'], 'layout'
-                        )
-                    elif source == 'pex':
-                        netlistpath = os.path.join(
-                            self.paths['netlist'], 'pex'
-                        )
-                    elif source == 'rcx':
-                        netlistpath = os.path.join(
-                            self.paths['netlist'], 'rcx'
-                        )
+            pdk_root = get_pdk_root()
+            pdk = get_pdk()
 
-                    dutpath = os.path.join(
-                        self.paths['root'],
-                        netlistpath,
-                        self.datasheet['name'] + '.spice',
-                    )
+            # Use the PDK xschemrc file for xschem startup
+            xschemrcfile = os.path.join(
+                pdk_root, pdk, 'libs.tech', 'xschem', 'xschemrc'
+            )
+            if os.path.isfile(xschemrcfile):
+                xschemrcargs = ['--rcfile', xschemrcfile]
+            else:
+                err(f'No xschemrc file found in the {pdk} PDK.')
+                xschemrcargs = []
+
+            # Read the xschem symbol and convert to primitive!
+            # It is copied for each simulation.
+
+            xschemname = dname + '.sym'
+
+            schempath = self.paths['schematic']
+            symbolfilename = os.path.join(schempath, xschemname)
+
+            if not os.path.isfile(symbolfilename):
+                err(f'Could not find xschem symbol {symbolfilename}.')
+                self.result_type = ResultType.ERROR
+                return
+
+            with open(symbolfilename, 'r') as ifile:
+                symboldata = ifile.read()
+                primdata = symboldata.replace(
+                    'type=subcircuit', 'type=primitive'
+                )
+
+            # For each condition set, substitute the
+            # testbench template with it
+            for index, condition_set in enumerate(condition_sets):
+
+                for collate_value, outpath in zip(
+                    collate_values, run_paths[index]
+                ):
 
-                    if not os.path.isfile(dutpath):
-                        err(f'Could not find dut netlist {dutpath}.')
+                    self.cancel_point()
+
+                    # Create directory for this run
+                    dbg(f"Creating directory: '{os.path.relpath(outpath)}'.")
+                    mkdirp(outpath)
 
                     reserved = {
                         'filename': os.path.splitext(template)[0],
                         'templates': os.path.abspath(self.paths['templates']),
                         'simpath': os.path.abspath(outpath),
-                        'DUT_name': self.datasheet['name'],
+                        'DUT_name': dname,
                         'netlist_source': source,
                         'N': index,
                         'DUT_path': os.path.abspath(dutpath),
-                        'PDK_ROOT': get_pdk_root(),
-                        'PDK': get_pdk(),
+                        'PDK_ROOT': pdk_root,
+                        'PDK': pdk,
                         'include_DUT': os.path.abspath(dutpath),
                         'random': str(
                             int(time.time() * 1000) & 0x7FFFFFFF
@@ -378,27 +422,9 @@ class ParameterNgspice(Parameter):
                         escape=True,
                     )
 
-                    # Copy the xschem symbol
-                    # and convert to primitive!
-
-                    dname = self.datasheet['name']
-                    xschemname = dname + '.sym'
-
-                    schempath = self.paths['schematic']
-                    symbolfilename = os.path.join(schempath, xschemname)
+                    # Copy the xschem symbol, converted to primitive
                     primfilename = os.path.join(outpath, xschemname)
 
-                    if not os.path.isfile(symbolfilename):
-                        err(f'Could not find xschem symbol {symbolfilename}.')
-                        self.result_type = ResultType.ERROR
-                        return
-
-                    with open(symbolfilename, 'r') as ifile:
-                        symboldata = ifile.read()
-                        primdata = symboldata.replace(
-                            'type=subcircuit', 'type=primitive'
-                        )
-
                     with open(primfilename, 'w') as ofile:
                         ofile.write(primdata)
 
@@ -437,17 +463,8 @@ class ParameterNgspice(Parameter):
                         tclstr,
                     ]
 
-                    pdk_root = get_pdk_root()
-                    pdk = get_pdk()
-
-                    # Use the PDK xschemrc file for xschem startup
-                    xschemrcfile = os.path.join(
-                        pdk_root, pdk, 'libs.tech', 'xschem', 'xschemrc'
-                    )
-                    if os.path.isfile(xschemrcfile):
-                        xschemargs.extend(['--rcfile', xschemrcfile])
-                    else:
-                        err(f'No xschemrc file found in the {pdk} PDK.')
+                    # Use the PDK xschemrc file, see above
+                    xschemargs.extend(xschemrcargs)
 
                     xschemargs.extend(
                         [
@@ -479,35 +496,18 @@ class ParameterNgspice(Parameter):
         # Run all simulations
         jobs = []
 
-        info(f'Parameter {self.param["name"]}: Running simulations…')
+        info(f'Parameter {pname}: Running simulations…')
 
         self.cancel_point()
 
         # Run simulation jobs sequentially
         if self.runtime_options['sequential']:
-            max_digits = len(str(len(condition_sets)))
-            for index, condition_set in enumerate(condition_sets):
-
-                # Inner loop for collate variable (if set)
-                collate_values = [1]
-                if self.get_argument('collate'):
-                    collate_values = collate_condition.values
-                    max_digits_collate = len(str(len(collate_values)))
+            for outpaths in run_paths:
 
-                for collate_index, collate_value in enumerate(collate_values):
+                for outpath in outpaths:
 
                     self.cancel_point()
 
-                    # Get directory for this run
-                    outpath = os.path.join(
-                        self.param_dir, f'run_{index:0{max_digits}d}'
-                    )
-
-                    if self.get_argument('collate'):
-                        outpath = os.path.join(
-                            outpath, f'run_{collate_index:0{max_digits}d}'
-                        )
-
                     new_sim_job = SimulationJob(
                         self.param,
                         outpath,
@@ -522,66 +522,51 @@ class ParameterNgspice(Parameter):
 
         # Run simulation jobs in parallel
         else:
-            # Use a thread pool to get the return value
-            with ThreadPool(processes=None) as pool:
-
-                # Schedule all simulations
-                max_digits = len(str(len(condition_sets)))
-                for index, condition_set in enumerate(condition_sets):
-
-                    # Inner loop for collate variable (if set)
-                    collate_values = [1]
-                    if self.get_argument('collate'):
-                        collate_values = collate_condition.values
-                        max_digits_collate = len(str(len(collate_values)))
-
-                    for collate_index, collate_value in enumerate(
-                        collate_values
-                    ):
-
-                        # Get directory for this run
-                        outpath = os.path.join(
-                            self.param_dir, f'run_{index:0{max_digits}d}'
-                        )
+            # Schedule all simulations
+            for outpaths in run_paths:
 
-                        if self.get_argument('collate'):
-                            outpath = os.path.join(
-                                outpath, f'run_{collate_index:0{max_digits}d}'
-                            )
+                for outpath in outpaths:
 
-                        new_sim_job = SimulationJob(
-                            self.param,
-                            outpath,
-                            os.path.splitext(template)[0] + '.spice',
-                            self.jobs_sem,
-                            self.step_cb,
-                        )
-                        self.add_simulation_job(new_sim_job)
+                    new_sim_job = SimulationJob(
+                        self.param,
+                        outpath,
+                        os.path.splitext(template)[0] + '.spice',
+                        self.jobs_sem,
+                        self.step_cb,
+                    )
+                    self.add_simulation_job(new_sim_job)
 
-                        jobs.append(pool.apply_async(new_sim_job.run, ()))
+                    jobs.append(new_sim_job)
 
-                # Wait for completion
-                while 1:
+            # Run the jobs in the thread pool shared by all parameters, and
+            # get the return codes in the order the simulations finish.
+            # Each wait only times out to check whether the parameter
+            # has been canceled.  Canceled jobs return None.
+            failed = False
+            pool = self.sim_pool()
+            returncodes = pool.imap_unordered(
+                operator.methodcaller('run'), jobs
+            )
+            for _ in jobs:
+                while True:
                     self.cancel_point()
-
-                    # Check if all tasks have completed
-                    if all([job.ready() for job in jobs]):
+                    try:
+                        returncode = returncodes.next(0.5)
                         break
+                    except multiprocessing.TimeoutError:
+                        pass
+                if returncode is not None and returncode != 0:
+                    failed = True
 
-                    time.sleep(0.1)
-
-                # Get the results
-                for job in jobs:
-                    if job.get() != 0:
-                        self.result_type = ResultType.ERROR
-                        return
+            self.cancel_point()
 
-                self.cancel_point()
+            if failed:
+                self.result_type = ResultType.ERROR
+                return
 
-        info(f'Parameter {self.param["name"]}: Collecting results…')
+        info(f'Parameter {pname}: Collecting results…')
 
         # Get the result
-        max_digits = len(str(len(condition_sets)))
         results_for_plot = []
 
         format = self.get_argument('format')
@@ -592,29 +577,13 @@ class ParameterNgspice(Parameter):
 
         for index, condition_set in enumerate(condition_sets):
 
-            # Inner loop for collate variable (if set)
-            collate_values = [1]
-            if self.get_argument('collate'):
-                collate_values = collate_condition.values
-                max_digits_collate = len(str(len(collate_values)))
-
             collated_values = {}
 
             for variable in variables:
                 if variable != None:
                     collated_values[variable] = []
 
-            for collate_index, collate_value in enumerate(collate_values):
-
-                # Get directory for this run
-                outpath = os.path.join(
-                    self.param_dir, f'run_{index:0{max_digits}d}'
-                )
-
-                if self.get_argument('collate'):
-                    outpath = os.path.join(
-                        outpath, f'run_{collate_index:0{max_digits}d}'
-                    )
+            for outpath in run_paths[index]:
 
                 # Read the result file
                 if format == 'ascii':
@@ -775,7 +744,7 @@ class ParameterNgspice(Parameter):
             f.write(simulation_summary)
 
         info(
-            f'Parameter {self.param["name"]}: Saving simulation summary as \'[repr.filename][link=file://{os.path.abspath(outpath_sim_summary)}]{os.path.relpath(outpath_sim_summary)}[/link][/repr.filename]\'…'
+            f"Parameter {pname}: Saving simulation summary as '[repr.filename][link=file://{os.path.abspath(outpath_sim_summary)}]{os.path.relpath(outpath_sim_summary)}[/link][/repr.filename]'…"
         )
 
         # Print the simulation summary in the console
@@ -1063,22 +1032,19 @@ class SimulationJob(threading.Thread):
         if self.subproc_handle:
             self.subproc_handle.kill()
 
-    def cancel_point(self):
-        """If canceled, exit the thread"""
-
-        if self.canceled:
-            sys.exit()
-
     def run_subprocess(self, proc, args=[], env=None, input=None, cwd=None):
 
         dbg(
             f'Subprocess {proc} {" ".join(args)} at \'[repr.filename][link=file://{os.path.abspath(cwd)}]{os.path.relpath(cwd)}[/link][/repr.filename]\'…'
         )
 
-        with subprocess.Popen(
+        stdout_path = f'{os.path.join(cwd, proc)}_stdout.out'
+
+        # stdout can be large, so it is written directly to its file
+        with open(stdout_path, 'w') as stdout_file, subprocess.Popen(
             [proc] + args,
             cwd=cwd,
-            stdout=subprocess.PIPE,
+            stdout=stdout_file,
             stderr=subprocess.PIPE,
             stdin=subprocess.PIPE if input else subprocess.DEVNULL,
             env=env,
@@ -1088,21 +1054,21 @@ class SimulationJob(threading.Thread):
             self.subproc_handle = process
 
             dbg(input)
-            stdout, stderr = process.communicate(input)
+            _, stderr = process.communicate(input)
             returncode = process.returncode
 
             if returncode != 0:
                 err(f'Subprocess exited with error code {returncode}')
 
-            # Print stderr
+            # Print stderr as a single block, so that parallel
+            # simulations don't contend for the logger on each line
             if stderr and returncode != 0:
                 err('Error output generated by subprocess:')
-                for line in stderr.splitlines():
-                    err(line.rstrip('\n'))
+                err(stderr.rstrip('\n'))
             else:
                 dbg('Error output generated by subprocess:')
-                for line in stderr.splitlines():
-                    dbg(line.rstrip('\n'))
+                if stderr:
+                    dbg(stderr.rstrip('\n'))
 
             # Write stderr to file
             if stderr:
@@ -1111,36 +1077,36 @@ class SimulationJob(threading.Thread):
                 ) as stderr_file:
                     stderr_file.write(stderr)
 
-            # Print stdout
+        # Print stdout, read back only if it is going to be logged
+        if get_log_level() <= LogLevels.DEBUG:
+            with open(stdout_path, 'r') as stdout_file:
+                stdout = stdout_file.read()
             if stdout:
                 dbg(f'Output from subprocess {proc}:')
-                for line in stdout.splitlines():
-                    dbg(line.rstrip())
-
-            # Write stdout to file
-            if stdout:
-                with open(
-                    f'{os.path.join(cwd, proc)}_stdout.out', 'w'
-                ) as stdout_file:
-                    stdout_file.write(stdout)
+                dbg(stdout.rstrip())
 
         self.subproc_handle = None
 
         return returncode
 
     def run(self):
-        self.cancel_point()
+        """Run the simulation, return its return code or None if canceled"""
+
+        if self.canceled:
+            return None
 
         # Acquire a job from the global jobs semaphore
         with self.jobs_sem:
-            self.cancel_point()
+            if self.canceled:
+                return None
 
             # Run ngspice
             returncode = self.run_subprocess(
                 'ngspice', ['--batch', self.simfile], cwd=self.outpath
             )
 
-            self.cancel_point()
+            if self.canceled:
+                return None
 
             self._return = returncode
 
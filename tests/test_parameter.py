@@ -0,0 +1,90 @@
+import threading
+
+from context import cace
+
+import cace.parameter.parameter
+from cace.parameter.parameter import Parameter, Condition
+
+
+class StubParameter(Parameter):
+    def implementation(self):
+        pass
+
+
+def make_parameter(tmp_path):
+    return StubParameter(
+        'test',
+        {'name': 'test', 'tool': 'stub'},
+        {'cace_format': 5.2},
+        'pdk',
+        {},
+        {},
+        str(tmp_path),
+        threading.Semaphore(),
+    )
+
+
+def substitute(tmp_path, text, conditions_set):
+    template_path = tmp_path / 'template.sch'
+    template_path.write_text(text)
+    substituted_path = tmp_path / 'substituted.sch'
+    make_parameter(tmp_path).substitute(
+        str(template_path), str(substituted_path), conditions_set, {}, []
+    )
+    return substituted_path.read_text()
+
+
+def test_substitute_bit(tmp_path):
+    text = 'CACE{bits[0]} CACE{bits[1]} CACE{bits[2]} CACE{bits[4]}\n'
+    assert substitute(tmp_path, text, {'bits': '6'}) == '0 1 1 0\n'
+
+
+def test_substitute_bit_slice(tmp_path):
+    text = 'CACE{bits[2:1]} CACE{bits[3:0]} CACE{bits[1:1]}\n'
+    assert substitute(tmp_path, text, {'bits': '6'}) == '11 0110 1\n'
+
+
+def test_substitute_reversed_bit_slice(tmp_path, monkeypatch):
+    errors = []
+    monkeypatch.setattr(cace.parameter.parameter, 'err', errors.append)
+    text = 'CACE{bits[0:2]}\n'
+    assert substitute(tmp_path, text, {'bits': '6'}) == '\n'
+    assert errors == ['Bit slice is not in [msb:lsb] order: bits[0:2]']
+
+
+def make_condition(name, values):
+    condition = Condition()
+    condition.name = name
+    condition.values = values
+    return condition
+
+
+def test_generate_condition_sets(tmp_path):
+    conditions = {
+        'a': make_condition('a', [1, 2]),
+        'b': make_condition('b', [3, 4]),
+        'c': make_condition('c', []),
+    }
+    # The first condition changes fastest
+    assert make_parameter(tmp_path).generate_condition_sets(conditions) == [
+        {'a': '1', 'b': '3', 'c': None},
+        {'a': '2', 'b': '3', 'c': None},
+        {'a': '1', 'b': '4', 'c': None},
+        {'a': '2', 'b': '4', 'c': None},
+    ]
+
+
+def test_merge_condition_sets(tmp_path):
+    condition_sets = [
+        {'a': '1', 'b': '3', 'N': '0'},
+        {'a': '1', 'b': '4', 'N': '1'},
+        {'b': '3', 'a': '1', 'N': '2'},
+        {'a': '2', 'b': '3', 'N': '3'},
+    ]
+    results_for_plot = [{'y': [0]}, {'y': [1]}, {'y': [2]}, {'y': [3]}]
+    # Condition sets are merged regardless of the order of their keys
+    assert make_parameter(tmp_path).merge_condition_sets(
+        condition_sets, results_for_plot, {'b', 'N'}
+    ) == ([{'a': '1'}, {'a': '2'}], [{'y': [0, 1, 2]}, {'y': [3]}])
+    # The results are not changed
+    assert results_for_plot == [{'y': [0]}, {'y': [1]}, {'y': [2]}, {'y': [3]}]